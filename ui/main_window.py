@@ -1,24 +1,698 @@
 from __future__ import annotations
 
+import io
 import json
+import math
 import os
+import re
 import shutil
+import stat
+import string
 import tempfile
+import time
 import urllib.error
 import urllib.request
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache, partial
 from getpass import getuser
 from pathlib import Path
 
 from PySide6 import QtCore, QtGui, QtWidgets, QtNetwork
 
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used without it
+    orjson = None
+
 from config import BASE_DIR, DEFAULT_PRESETS, PROJECT_MANAGER_VERSION, SUITE_VERSION, load_config, save_config
 from storage import _try_set_hidden, list_projects, load_loans, save_loans
-from workers import MoveWorker, _handle_remove_readonly
+from workers import MoveWorker, TaskRunnable, _handle_remove_readonly
 from ui.dialogs import SetupDialog
 from ui.widgets import ProjectCard, ProjectItem, TitleBar
 
 
+def _compact_qss(text: str) -> str:
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+_STYLESHEET_TEMPLATE = string.Template(
+    _compact_qss(
+        """
+        #background {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 $bg2, stop:1 $bg2);
+        }
+        #titleBar {
+            background: $titlebar_bg;
+            border: none;
+            border-bottom: 1px solid $border;
+        }
+        #titleBarLogo { margin: 0; padding: 0; }
+        QToolButton#titleBarButton,
+        QToolButton#closeButton {
+            background: transparent;
+            color: $titlebar_text;
+            border: none;
+            border-radius: 0;
+            padding: 0;
+            margin: 0;
+            min-width: 37px;
+            max-width: 37px;
+            min-height: 31px;
+            max-height: 31px;
+        }
+        #settingsButton {
+            background: transparent;
+            color: $titlebar_text;
+            border: none;
+            padding: 0 4px;
+            font: 12px "Segoe UI";
+        }
+        #settingsButton:hover { background: $titlebar_hover; color: #ffffff; }
+        #settingsButton:pressed { background: $titlebar_bg; }
+        QToolButton#titleBarButton:hover { background: $titlebar_hover; }
+        QToolButton#titleBarButton:pressed { background: $titlebar_bg; }
+        QToolButton#closeButton { background: transparent; border: none; }
+        QToolButton#closeButton:hover { background: #b31b1b; color: #ffffff; }
+        QToolButton#closeButton:pressed { background: #8a1111; }
+        #navContainer {
+            background: $nav_bg;
+            border-right: 1px solid $border;
+        }
+        #navOverlay {
+            background: $nav_bg;
+            border-right: 1px solid $border;
+        }
+        #navSeparator {
+            background: $border;
+        }
+        #navList {
+            background: $nav_bg;
+            border: none;
+            color: $nav_text;
+            font: 12px "Segoe UI";
+            outline: none;
+        }
+        #navList::item {
+            padding: 8px 6px;
+            margin: 1px 0;
+        }
+        #navList::item:selected {
+            background: transparent;
+            color: $nav_text;
+            border-left: 3px solid $accent;
+            padding-left: 9px;
+        }
+        #navList::item:hover {
+            background: $nav_hover;
+        }
+        QMenu {
+            background: $bg3;
+            color: $text_primary;
+            border: 1px solid $border;
+            border-radius: 10px;
+            padding: 4px;
+        }
+        QMenu[menuRole="top"]::right-arrow {
+            image: none;
+            width: 0px;
+            height: 0px;
+        }
+        QMenu::item {
+            padding: 8px 12px;
+            border-radius: 8px;
+        }
+        QMenu::item:selected {
+            background: $nav_hover;
+            color: $text_primary;
+        }
+        QToolButton#settingsButton::menu-indicator { image: none; width: 0px; height: 0px; }
+        QRadioButton { color: $text_primary; }
+        QCheckBox { color: $text_primary; }
+        QLineEdit#settingsField {
+            background: $bg3;
+            border: 1px solid $border_alt;
+            color: $text_primary;
+            border-radius: 8px;
+            padding: 6px 10px;
+            min-height: 26px;
+        }
+        QLineEdit#settingsField:focus { border: 1px solid $accent; }
+        #bottomBar {
+            background: $bg1;
+            border-top: 1px solid $border;
+        }
+        QTabWidget::tab-bar {
+            background: $bg1;
+            padding: 6px 10px;
+            border: 1px solid $border;
+            border-radius: 8px;
+        }
+        QTabWidget::pane { border: none; top: 0px; }
+        QTabBar::tab {
+            background: transparent;
+            padding: 10px 14px;
+            font: 600 13px "Segoe UI";
+            color: $text_muted;
+            margin-right: 4px;
+            border-radius: 6px 6px 0 0;
+            border-top: 2px solid transparent;
+            border-bottom: 0;
+        }
+        QTabBar::tab:selected {
+            color: $text_primary;
+            background: $bg1;
+            border: none;
+            border-top: 4px solid $accent;
+            margin-bottom: 0;
+            border-radius: 0;
+        }
+        QTabBar::tab:hover { color: $text_primary; }
+        #heroTitle {
+            color: $text_primary;
+            font: 600 24px "Segoe UI";
+            letter-spacing: 0.4px;
+        }
+        #footer {
+            color: $text_muted;
+            font: 11px "Segoe UI";
+        }
+        #card {
+            background: $bg3;
+            border: 1px solid $border_alt;
+            border-radius: 14px;
+        }
+        #libraryPanel {
+            background: $bg3;
+            border: 1px solid $border_alt;
+            border-radius: 12px;
+        }
+        #libraryTree {
+            background: transparent;
+            border: none;
+            color: $text_primary;
+            font: 12px "Consolas";
+        }
+        #libraryTree::item { padding: 4px 6px; margin: 1px 0; }
+        #libraryTree::item:selected { background: $hover; color: $text_primary; }
+        QSplitter#blockSplitter::handle { background: $border; }
+        #blockPaletteBar {
+            background: $bg1;
+            border-bottom: 1px solid $border;
+        }
+        #cardTitle {
+            color: $text_primary;
+            font: 600 16px "Segoe UI";
+        }
+        #projectList {
+            background: transparent;
+            border: none;
+            color: $text_primary;
+            font: 13px "Consolas";
+            outline: none;
+        }
+        #projectList::item { margin: 6px 4px; }
+        #projectList::item:selected { background: transparent; }
+        #projectList::item:hover { background: transparent; }
+        QWidget#projectItem {
+            background: $project_item_bg;
+            border: 1px solid $border_alt;
+            border-radius: 12px;
+        }
+        QWidget#projectItem:hover { background: $project_item_hover; }
+        #libraryList {
+            background: $bg3;
+            border: 1px solid $border_alt;
+            color: $text_primary;
+            font: 12px "Consolas";
+        }
+        #libraryList::item { padding: 6px 6px; }
+        #libraryList::item:selected { background: $hover; }
+        #aboutShell {
+            background: $bg3;
+            border: 1px solid $border;
+            border-radius: 14px;
+        }
+        #aboutShell QLabel {
+            color: $text_primary;
+        }
+        #aboutShell QLabel#holderLabel {
+            color: $text_muted;
+        }
+        #aboutInfo {
+            font: 500 12px "Segoe UI";
+        }
+        #aboutCloseButton {
+            background: transparent;
+            color: $text_primary;
+            border: none;
+            font: 600 16px "Segoe UI";
+            padding: 0 6px;
+            min-width: 28px;
+            min-height: 28px;
+        }
+        #aboutCloseButton:hover { background: $hover; border-radius: 8px; }
+        #coachOverlay { background: transparent; }
+        #coachCard {
+            background: $bg3;
+            border: 1px solid $border;
+            border-radius: 14px;
+        }
+        #coachTitle { color: $text_primary; font: 650 14px "Segoe UI"; }
+        #coachBody { color: $text_primary; font: 12px "Segoe UI"; }
+        #primaryButton {
+            background: $accent;
+            color: #ffffff;
+            border: none;
+            border-radius: 12px;
+            padding: 10px 18px;
+            font: 600 13px "Segoe UI";
+        }
+        #primaryButton:hover { background: $accent_hover; }
+        #primaryButton:pressed { background: $accent_pressed; }
+        #actionButton {
+            background: #0dbc79;
+            color: #ffffff;
+            border: none;
+            border-radius: 10px;
+            padding: 8px 12px;
+            font: 600 12px "Segoe UI";
+        }
+        #actionButton:hover { background: #10a36f; }
+        #actionButton:pressed { background: #0b7d59; }
+        #secondaryButton {
+            background: $bg2;
+            color: $text_primary;
+            border: 1px solid $border_alt;
+            border-radius: 10px;
+            padding: 8px 12px;
+            font: 600 12px "Segoe UI";
+        }
+        #secondaryButton:hover { background: $hover; }
+        #secondaryButton:pressed { background: $bg1; }
+        #dangerButton {
+            background: #f14c4c;
+            color: #ffffff;
+            border: none;
+            border-radius: 10px;
+            padding: 8px 12px;
+            font: 600 12px "Segoe UI";
+        }
+        #dangerButton:hover { background: #f0626c; }
+        #dangerButton:pressed { background: #b31b1b; }
+        #itemName { font: 600 13px "Segoe UI"; color: $text_primary; }
+        #holderLabel { font: 11px "Segoe UI"; color: $text_muted; }
+        #searchField {
+            background: $bg3;
+            border: 1px solid $border_alt;
+            color: $text_primary;
+            border-radius: 6px;
+            padding: 6px 10px;
+            font: 12px "Segoe UI";
+        }
+        #searchField:focus { border: 1px solid $accent; }
+        """
+    )
+)
+
+_STYLESHEET_KEYS = tuple(sorted(_STYLESHEET_TEMPLATE.get_identifiers()))
+
+
+@lru_cache(maxsize=8)
+def _render_stylesheet(replacements: tuple[tuple[str, str], ...]) -> str:
+    return _STYLESHEET_TEMPLATE.safe_substitute(dict(replacements))
+
+
+def _vbox(
+    parent: QtWidgets.QWidget | None = None,
+    margins: tuple[int, int, int, int] | None = None,
+    spacing: int | None = None,
+) -> QtWidgets.QVBoxLayout:
+    layout = QtWidgets.QVBoxLayout(parent) if parent is not None else QtWidgets.QVBoxLayout()
+    if margins is not None:
+        layout.setContentsMargins(*margins)
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    return layout
+
+
+def _hbox(
+    parent: QtWidgets.QWidget | None = None,
+    margins: tuple[int, int, int, int] | None = None,
+    spacing: int | None = None,
+) -> QtWidgets.QHBoxLayout:
+    layout = QtWidgets.QHBoxLayout(parent) if parent is not None else QtWidgets.QHBoxLayout()
+    if margins is not None:
+        layout.setContentsMargins(*margins)
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    return layout
+
+
+@lru_cache(maxsize=512)
+def _list_dir_cached(path_str: str, mtime_ns: int) -> tuple[tuple[str, bool, bool], ...]:
+    # mtime_ns is only part of the cache key: a changed directory gets a fresh listing.
+    entries = []
+    with os.scandir(path_str) as it:
+        for entry in it:
+            try:
+                entries.append((entry.name, entry.is_file(), entry.is_dir()))
+            except OSError:
+                continue
+    entries.sort(key=lambda e: (e[1], e[0].lower()))
+    return tuple(entries)
+
+
+def _scan_copy_tree(src: Path, dst: Path) -> tuple[list[Path], list[tuple[str, Path, int]], int]:
+    # One scandir pass yields the directories to create, the files to copy and the total size.
+    dirs: list[Path] = []
+    files: list[tuple[str, Path, int]] = []
+    total_bytes = 0
+    pending = [(str(src), dst)]
+    while pending:
+        src_dir, dst_dir = pending.pop()
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = dst_dir / entry.name
+                if entry.is_dir():
+                    dirs.append(target)
+                    if not entry.is_symlink():
+                        pending.append((entry.path, target))
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = 0
+                files.append((entry.path, target, size))
+                total_bytes += size
+    return dirs, files, total_bytes
+
+
+_COPY_FILE_RANGE_MIN = 1 << 20
+
+
+def _copy_file(src: str, dst: Path, size: int) -> None:
+    # copy_file_range lets the kernel copy (or reflink) large files without a user-space buffer.
+    if size >= _COPY_FILE_RANGE_MIN and hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+_PARALLEL_COPY_MIN_FILES = 16
+_PARALLEL_COPY_MIN_BYTES = 16 << 20
+_PARALLEL_COPY_WORKERS = 8
+
+
+def _copy_files(files: list[tuple[str, Path, int]], total_bytes: int):
+    if len(files) <= _PARALLEL_COPY_MIN_FILES or total_bytes <= _PARALLEL_COPY_MIN_BYTES:
+        for src, dst, size in files:
+            _copy_file(src, dst, size)
+            yield size
+        return
+    # Network shares are latency bound; a few concurrent streams keep the link busy.
+    with ThreadPoolExecutor(max_workers=_PARALLEL_COPY_WORKERS) as pool:
+        futures = {pool.submit(_copy_file, src, dst, size): size for src, dst, size in files}
+        try:
+            for future in as_completed(futures):
+                future.result()
+                yield futures[future]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+_BASIC_MARKER_RE = re.compile(rb'"kind"\s*:\s*"basic"|"basic"\s*:\s*true')
+
+
+def _probe_basic(path: Path) -> bool:
+    """Cheap pre-check for a basic definition; a match is confirmed by the full parse."""
+    try:
+        with path.open("rb") as f:
+            return _BASIC_MARKER_RE.search(f.read()) is not None
+    except OSError:
+        return False
+
+
+def _load_json_file(path: Path):
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals, which only the stdlib parser accepts
+    return json.loads(raw.decode("utf-8"))
+
+
+def _dump_json_pretty(data) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+_BACKUP_INDEX_NAME = "backup_index.json"
+_BACKUP_KEEP = 5
+
+
+def _read_backup_index(folder: Path) -> list[list]:
+    """Return ``[timestamp, size_bytes]`` entries, oldest first; merges in a folder listing when the index is stale."""
+    entries = None
+    index_mtime = -1
+    try:
+        index = folder / _BACKUP_INDEX_NAME
+        index_mtime = index.stat().st_mtime_ns
+        data = json.loads(index.read_text(encoding="utf-8"))
+        if isinstance(data, list) and all(isinstance(e, list) and len(e) == 2 and isinstance(e[0], str) for e in data):
+            entries = data
+    except (OSError, ValueError):
+        pass
+    # A folder changed after the index was written means another machine or a failed run added/removed backups.
+    if entries is not None and folder.stat().st_mtime_ns <= index_mtime:
+        return entries
+    known = {e[0]: e for e in entries or []}
+    with os.scandir(folder) as it:
+        names = sorted(entry.name for entry in it if entry.is_dir(follow_symlinks=False))
+    return [known.get(name, [name, None]) for name in names]
+
+
+def _write_backup_index(folder: Path, entries: list[list]) -> None:
+    (folder / _BACKUP_INDEX_NAME).write_text(json.dumps(entries), encoding="utf-8")
+
+
+class AboutDialog(QtWidgets.QDialog):
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setWindowFlags(QtCore.Qt.FramelessWindowHint | QtCore.Qt.Dialog)
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
+        self._drag_pos: QtCore.QPointF | None = None
+        self.setObjectName("aboutDialog")
+        self.setFixedSize(420, 240)
+
+        outer = _vbox(self, (10, 10, 10, 10), 0)
+
+        shell = QtWidgets.QFrame()
+        shell.setObjectName("aboutShell")
+        shell_layout = _vbox(shell, (16, 14, 16, 14), 10)
+
+        header = _hbox(spacing=8)
+        header_title = QtWidgets.QLabel("About Neuranel")
+        header_title.setObjectName("cardTitle")
+        header.addWidget(header_title)
+        header.addStretch(1)
+        self.close_icon = QtWidgets.QToolButton()
+        self.close_icon.setText("×")
+        self.close_icon.setObjectName("aboutCloseButton")
+        self.close_icon.setCursor(QtCore.Qt.PointingHandCursor)
+        self.close_icon.clicked.connect(self.reject)
+        header.addWidget(self.close_icon)
+        shell_layout.addLayout(header)
+
+        self.version_label = QtWidgets.QLabel("")
+        self.version_label.setObjectName("holderLabel")
+        shell_layout.addWidget(self.version_label)
+
+        self.info_text = QtWidgets.QLabel("")
+        self.info_text.setObjectName("aboutInfo")
+        self.info_text.setWordWrap(True)
+        shell_layout.addWidget(self.info_text, 1)
+
+        self.close_btn = QtWidgets.QPushButton("Schließen")
+        self.close_btn.setObjectName("actionButton")
+        self.close_btn.setCursor(QtCore.Qt.PointingHandCursor)
+        self.close_btn.clicked.connect(self.accept)
+        btn_row = QtWidgets.QHBoxLayout()
+        btn_row.addStretch(1)
+        btn_row.addWidget(self.close_btn)
+        shell_layout.addLayout(btn_row)
+
+        outer.addWidget(shell, 1)
+
+    def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
+        if event.button() == QtCore.Qt.LeftButton:
+            self._drag_pos = event.globalPosition() - QtCore.QPointF(self.frameGeometry().topLeft())
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:
+        if event.buttons() & QtCore.Qt.LeftButton and self._drag_pos is not None:
+            self.move((event.globalPosition() - self._drag_pos).toPoint())
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
+        self._drag_pos = None
+        super().mouseReleaseEvent(event)
+
+
+class SettingsDialogController(QtCore.QObject):
+    def __init__(
+        self,
+        window: "MainWindow",
+        dialog: QtWidgets.QDialog,
+        shared_input: QtWidgets.QLineEdit,
+        local_input: QtWidgets.QLineEdit,
+        backup_input: QtWidgets.QLineEdit,
+        accent_input: QtWidgets.QLineEdit,
+        dark_radio: QtWidgets.QRadioButton,
+        light_radio: QtWidgets.QRadioButton,
+        libraries_list: QtWidgets.QListWidget,
+        divider: QtWidgets.QFrame,
+        nav_list: QtWidgets.QListWidget,
+    ) -> None:
+        super().__init__(dialog)
+        self.window = window
+        self.dialog = dialog
+        self.shared_input = shared_input
+        self.local_input = local_input
+        self.backup_input = backup_input
+        self.accent_input = accent_input
+        self.dark_radio = dark_radio
+        self.light_radio = light_radio
+        self.libraries_list = libraries_list
+        self.divider = divider
+        self.nav_list = nav_list
+        self._last_dialog_theme: str | None = None
+        self._known_library_paths: set[str] = set()
+        self.sync_known_library_paths()
+
+    def reset(self) -> None:
+        window = self.window
+        self.nav_list.setCurrentRow(0)
+        self.shared_input.setText(str(window.shared_dir))
+        self.local_input.setText(str(window.local_dir))
+        self.backup_input.setText(str(window.backup_dir) if window.backup_dir else "")
+        radio = self.light_radio if window.config.get("theme", "dark") == "light" else self.dark_radio
+        blockers = (QtCore.QSignalBlocker(self.dark_radio), QtCore.QSignalBlocker(self.light_radio))
+        radio.setChecked(True)
+        del blockers
+        self.accent_input.setText(window.accent_color or "#007acc")
+        self.libraries_list.clear()
+        self.libraries_list.addItems(list(window.library_paths))
+        self.sync_known_library_paths()
+        self._last_dialog_theme = None
+        self.apply_dialog_theme()
+
+    def selected_theme(self) -> str:
+        return "light" if self.light_radio.isChecked() else "dark"
+
+    def browse_shared(self) -> None:
+        path = QtWidgets.QFileDialog.getExistingDirectory(
+            self.window, "Shared Ordner waehlen", self.shared_input.text() or str(self.window.shared_dir)
+        )
+        if path:
+            self.shared_input.setText(path)
+
+    def browse_local(self) -> None:
+        path = QtWidgets.QFileDialog.getExistingDirectory(
+            self.window, "Local Ordner waehlen", self.local_input.text() or str(self.window.local_dir)
+        )
+        if path:
+            self.local_input.setText(path)
+
+    def browse_backup(self) -> None:
+        start = self.backup_input.text() or self.shared_input.text() or str(BASE_DIR)
+        path = QtWidgets.QFileDialog.getExistingDirectory(self.window, "Backup Ordner waehlen", start)
+        if path:
+            self.backup_input.setText(path)
+
+    def pick_accent(self) -> None:
+        window = self.window
+        if window._color_dialog is None:
+            window._color_dialog = QtWidgets.QColorDialog(window)
+        window._color_dialog.setCurrentColor(QtGui.QColor(self.accent_input.text() or window.accent_color))
+        if window._color_dialog.exec():
+            color = window._color_dialog.currentColor()
+            if color.isValid():
+                self.accent_input.setText(color.name())
+
+    def load_preset(self, theme_name: str) -> None:
+        preset = self.window.config.get("presets", {}).get(theme_name, {})
+        if isinstance(preset, dict):
+            self.accent_input.setText(preset.get("accent", self.accent_input.text()))
+
+    def sync_known_library_paths(self, *_args) -> None:
+        self._known_library_paths = set(MainWindow._collect_library_paths(self.libraries_list))
+
+    def add_library_path(self) -> None:
+        library_paths = self.window.library_paths
+        start_dir = library_paths[0] if library_paths else str(BASE_DIR)
+        path = QtWidgets.QFileDialog.getExistingDirectory(self.window, "Library-Ordner waehlen", start_dir)
+        if path and path not in self._known_library_paths:
+            self._known_library_paths.add(path)
+            self.libraries_list.addItem(path)
+
+    def remove_library_path(self) -> None:
+        row = self.libraries_list.currentRow()
+        if row >= 0:
+            self.libraries_list.takeItem(row)
+            self.sync_known_library_paths()
+
+    def apply_dialog_theme(self) -> None:
+        theme_name = self.selected_theme()
+        if theme_name == self._last_dialog_theme:
+            return
+        self._last_dialog_theme = theme_name
+        dialog_colors = self.window._current_colors(theme_override=theme_name)
+        self.dialog.setStyleSheet(self.window._build_stylesheet(dialog_colors))
+        self.divider.setStyleSheet(f"background: {dialog_colors['border']}; border: none;")
+
+    def on_dark_toggled(self, checked: bool) -> None:
+        if not checked:
+            return
+        self.load_preset("dark")
+        self.apply_dialog_theme()
+
+    def on_light_toggled(self, checked: bool) -> None:
+        if not checked:
+            return
+        self.load_preset("light")
+        self.apply_dialog_theme()
+
+    def save(self) -> None:
+        self.window._apply_settings(
+            self.shared_input.text().strip(),
+            self.local_input.text().strip(),
+            self.backup_input.text().strip(),
+            self.dialog,
+            self.accent_input.text().strip(),
+            self.selected_theme(),
+            MainWindow._collect_library_paths(self.libraries_list),
+        )
+
+
 class MainWindow(QtWidgets.QMainWindow):
     UPDATE_URL = "https://raw.githubusercontent.com/Eylius/neuranel/main/updates/version.json"
 
@@ -38,7 +712,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self._setup_palette()
         self._suite_version = SUITE_VERSION
         self._pm_version = PROJECT_MANAGER_VERSION
+        self._qt_version_str = getattr(QtCore, "QT_VERSION_STR", None) or QtCore.qVersion()
+        self._about_dialog: AboutDialog | None = None
+        self._color_dialog: QtWidgets.QColorDialog | None = None
+        self.library_tree: LibraryTree | None = None
+        self.block_editor: NodeEditorWidget | None = None
+        self.block_editor_tab: QtWidgets.QWidget | None = None
+        self.status_label: QtWidgets.QLabel | None = None
+        self._library_tree_loaded = False
+        self._library_items: dict[str, QtWidgets.QTreeWidgetItem] = {}
+        self._settings_controller: SettingsDialogController | None = None
+        self._onboarding_overlay: CoachMarkOverlay | None = None
         self.config: dict = load_config()
+        self._colors_cache: dict[tuple, dict[str, str]] = {}
+        self._cached_stylesheet: str | None = None
+        self._cached_stylesheet_theme: str | None = None
+        self._applied_stylesheet: str | None = None
         self._ensure_theme_defaults()
         self.theme: str = self.config.get("theme", "dark")
         if self.theme not in DEFAULT_PRESETS:
@@ -52,17 +741,32 @@ class MainWindow(QtWidgets.QMainWindow):
             or self.config.get("accent_color2", DEFAULT_PRESETS["dark"]["accent2"])
         )
         self.loans: dict = {}
+        self._loans_flat: dict[str, tuple[str | None, str | None]] = {}
         self.local_borrowed: dict = {}
         self.local_copied: dict = {}
         self._threads: list[QtCore.QThread] = []
         self._workers: list[MoveWorker] = []
         self._worker_context: dict[MoveWorker, dict] = {}
         self._busy: bool = False
+        self._awaiting_lists = False
         self._shared_all: list[str] = []
         self._local_all: list[str] = []
+        self._shared_all_lower: list[str] = []
+        self._local_all_lower: list[str] = []
+        self._shared_filter_term: str | None = None
+        self._local_filter_term: str | None = None
         self._last_loans: dict | None = None
         self._last_shared: list[str] | None = None
         self._last_local: list[str] | None = None
+        self._last_mtimes: tuple | None = None
+        self._refresh_generation = 0
+        # A forced refresh must not be lost when a later, unforced one supersedes it.
+        self._pending_force = False
+        self._refresh_tasks: set[TaskRunnable] = set()
+        self._last_title_local: list[str] | None = None
+        self._shared_check_dir: Path | None = None
+        self._shared_read_ok_until = 0.0
+        self._shared_rw_ok_until = 0.0
         self._nav_anim: QtCore.QPropertyAnimation | None = None
         self._update_check_manager: QtNetwork.QNetworkAccessManager | None = None
         self._update_download_manager: QtNetwork.QNetworkAccessManager | None = None
@@ -274,7 +978,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._refresh_local_borrowed()
         if new_loans == self._last_loans:
             return
-        self.loans = new_loans
+        self._set_loans(new_loans)
         self._last_loans = new_loans
         if hasattr(self, "shared_view"):
             self._apply_shared_filter()
@@ -314,7 +1018,7 @@ class MainWindow(QtWidgets.QMainWindow):
         dialog.setObjectName("background")
         dialog.setModal(True)
         dialog.setMinimumSize(520, 360)
-        dialog.setStyleSheet(self._build_stylesheet(self._current_colors()))
+        dialog.setStyleSheet(self._get_current_stylesheet())
 
         layout = QtWidgets.QVBoxLayout(dialog)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -375,7 +1079,7 @@ class MainWindow(QtWidgets.QMainWindow):
         worker = UpdateCheckWorker(self.UPDATE_URL)
         worker.moveToThread(thread)
         thread.started.connect(worker.run)
-        worker.finished.connect(self._handle_update_check_result)
+        worker.finished.connect(self._handle_update_check_result, QtCore.Qt.QueuedConnection)
         worker.finished.connect(thread.quit)
         worker.finished.connect(worker.deleteLater)
         thread.finished.connect(thread.deleteLater)
@@ -422,7 +1126,7 @@ class MainWindow(QtWidgets.QMainWindow):
         dialog.setObjectName("background")
         dialog.setModal(True)
         dialog.setMinimumSize(520, 260)
-        dialog.setStyleSheet(self._build_stylesheet(self._current_colors()))
+        dialog.setStyleSheet(self._get_current_stylesheet())
 
         layout = QtWidgets.QVBoxLayout(dialog)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -477,8 +1181,8 @@ class MainWindow(QtWidgets.QMainWindow):
         progress.setWindowTitle("Update")
         progress.setAutoClose(False)
         progress.setAutoReset(False)
-        progress.setStyleSheet(self._build_stylesheet(self._current_colors()))
-        progress.canceled.connect(lambda: reply.abort())
+        progress.setStyleSheet(self._get_current_stylesheet())
+        progress.canceled.connect(reply.abort)
         self._update_progress = progress
         progress.show()
 
@@ -563,7 +1267,7 @@ class MainWindow(QtWidgets.QMainWindow):
         dialog.setObjectName("background")
         dialog.setModal(True)
         dialog.setMinimumSize(520, 360)
-        dialog.setStyleSheet(self._build_stylesheet(self._current_colors()))
+        dialog.setStyleSheet(self._get_current_stylesheet())
 
         layout = QtWidgets.QVBoxLayout(dialog)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -594,7 +1298,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         if not force and self.config.get("onboarding"):
             return
-        if getattr(self, "_onboarding_overlay", None) is not None:
+        if self._onboarding_overlay is not None:
             try:
                 self._onboarding_overlay.hide()
                 self._onboarding_overlay.deleteLater()
@@ -654,6 +1358,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if index < 0 or not hasattr(self, "stack"):
             return
         self.stack.setCurrentIndex(index)
+        if not self._library_tree_loaded and self.stack.currentWidget() is self.block_editor_tab:
+            self._refresh_library_tree()
 
     def _on_editor_dirty_changed(self, dirty: bool) -> None:
         if hasattr(self, "save_component_btn"):
@@ -786,6 +1492,14 @@ class MainWindow(QtWidgets.QMainWindow):
             "Komponenten bestehen nur aus Basic-Blocks. Ziehe sie aus dem Ordner 'basic' der Libraries in das Fenster.",
         )
 
+    def _add_named_connector(self, kind: str) -> None:
+        if not self.block_editor.add_connector_to_selected(kind):
+            QtWidgets.QMessageBox.information(
+                self,
+                "Kein Block ausgew\u00e4hlt",
+                "Waehle zuerst einen Block im Editor aus, um Anschluesse hinzuzufuegen.",
+            )
+
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
         if obj == getattr(self, "options_btn", None):
             if event.type() == QtCore.QEvent.Enter:
@@ -1059,12 +1773,14 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.block_editor.current_component_path:
             QtWidgets.QMessageBox.information(self, "Keine Komponente", "Bitte erst eine Komponente öffnen.")
             return
-        try:
-            with path_obj.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception:
-            data = {}
-        if not (data.get("kind") == "basic" or data.get("basic") is True or self._is_basic_item(item, path_obj)):
+        data = {}
+        is_basic_item = self._is_basic_item(item, path_obj)
+        if is_basic_item or _probe_basic(path_obj):
+            try:
+                data = _load_json_file(path_obj)
+            except Exception:
+                data = {}
+        if not (data.get("kind") == "basic" or data.get("basic") is True or is_basic_item):
             QtWidgets.QMessageBox.information(self, "Nur Basic-Block", "Dieses Element ist keine Basic-Definition.")
             return
         self.block_editor.add_basic_block(data, path_obj.stem)
@@ -1335,8 +2051,17 @@ class MainWindow(QtWidgets.QMainWindow):
         self.shared_view = ProjectCard("Shared", with_header=False)
         self.local_view = ProjectCard("Local", with_header=False)
 
-        self.shared_view.search_edit.textChanged.connect(self._apply_shared_filter)
-        self.local_view.search_edit.textChanged.connect(self._apply_local_filter)
+        # Coalesce keystrokes so the lists are only refilled once typing pauses.
+        self._shared_filter_timer = QtCore.QTimer(self)
+        self._shared_filter_timer.setSingleShot(True)
+        self._shared_filter_timer.setInterval(120)
+        self._shared_filter_timer.timeout.connect(self._on_shared_search_changed)
+        self._local_filter_timer = QtCore.QTimer(self)
+        self._local_filter_timer.setSingleShot(True)
+        self._local_filter_timer.setInterval(120)
+        self._local_filter_timer.timeout.connect(self._on_local_search_changed)
+        self.shared_view.search_edit.textChanged.connect(self._shared_filter_timer.start)
+        self.local_view.search_edit.textChanged.connect(self._local_filter_timer.start)
 
         lists_layout = QtWidgets.QHBoxLayout()
         lists_layout.setSpacing(12)
@@ -1403,12 +2128,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _build_block_editor_tab(self) -> QtWidgets.QWidget:
         tab = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(tab)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(10)
+        layout = _vbox(tab, (12, 12, 12, 12), 10)
 
-        header = QtWidgets.QHBoxLayout()
-        header.setSpacing(8)
+        header = _hbox(spacing=8)
         title = QtWidgets.QLabel("Funktionsbl\u00f6cke")
         title.setObjectName("heroTitle")
         header.addWidget(title)
@@ -1437,12 +2159,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         library_panel = QtWidgets.QFrame()
         library_panel.setObjectName("libraryPanel")
-        library_layout = QtWidgets.QVBoxLayout(library_panel)
-        library_layout.setContentsMargins(8, 8, 8, 8)
-        library_layout.setSpacing(6)
+        library_layout = _vbox(library_panel, (8, 8, 8, 8), 6)
 
-        library_header = QtWidgets.QHBoxLayout()
-        library_header.setSpacing(6)
+        library_header = _hbox(spacing=6)
         library_title = QtWidgets.QLabel("Libraries")
         library_title.setObjectName("cardTitle")
         library_header.addWidget(library_title)
@@ -1460,6 +2179,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.library_tree.setHeaderHidden(True)
         self.library_tree.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.library_tree.customContextMenuRequested.connect(self._on_library_context_menu)
+        self.library_tree.itemExpanded.connect(self._on_library_item_expanded)
         self.library_tree.setDragEnabled(True)
         self.library_tree.setDefaultDropAction(QtCore.Qt.CopyAction)
         self.library_tree.setIndentation(12)
@@ -1469,48 +2189,41 @@ class MainWindow(QtWidgets.QMainWindow):
 
         editor_container = QtWidgets.QFrame()
         editor_container.setObjectName("blockEditorContainer")
-        editor_layout = QtWidgets.QVBoxLayout(editor_container)
-        editor_layout.setContentsMargins(0, 0, 0, 0)
-        editor_layout.setSpacing(0)
+        editor_layout = _vbox(editor_container, (0, 0, 0, 0), 0)
 
         palette_bar = QtWidgets.QFrame()
         palette_bar.setObjectName("blockPaletteBar")
-        palette_layout = QtWidgets.QHBoxLayout(palette_bar)
-        palette_layout.setContentsMargins(12, 8, 12, 8)
-        palette_layout.setSpacing(8)
+        palette_layout = _hbox(palette_bar, (12, 8, 12, 8), 8)
         palette_label = QtWidgets.QLabel("Element einf\u00fcgen:")
         palette_label.setObjectName("itemName")
         palette_layout.addWidget(palette_label)
 
-        def add_named_block(name: str) -> None:
-            if not self.block_editor.add_connector_to_selected("input" if name == "Eingang" else "output"):
-                QtWidgets.QMessageBox.information(
-                    self,
-                    "Kein Block ausgew\u00e4hlt",
-                    "Waehle zuerst einen Block im Editor aus, um Anschluesse hinzuzufuegen.",
-                )
-
-        for block_name in ("Eingang", "Ausgang"):
-            btn = PaletteDragButton(block_name, "input" if block_name == "Eingang" else "output")
+        for block_name, port_kind in (("Eingang", "input"), ("Ausgang", "output")):
+            btn = PaletteDragButton(block_name, port_kind)
             btn.setObjectName("secondaryButton")
             btn.setCursor(QtCore.Qt.PointingHandCursor)
-            btn.clicked.connect(lambda checked=False, n=block_name: add_named_block(n))
+            btn.clicked.connect(lambda checked=False, k=port_kind: self._add_named_connector(k))
             palette_layout.addWidget(btn)
 
         self.line_btn = QtWidgets.QPushButton("Line")
         self.line_btn.setCheckable(True)
         self.line_btn.setObjectName("secondaryButton")
         self.line_btn.setCursor(QtCore.Qt.PointingHandCursor)
-        self.line_btn.toggled.connect(lambda checked: self.block_editor.toggle_line_mode(checked))
         palette_layout.addWidget(self.line_btn)
 
         palette_layout.addStretch(1)
         editor_layout.addWidget(palette_bar)
 
-        self.block_editor = NodeEditorWidget(self.accent_color, self.accent_color2, self)
+        self.block_editor = NodeEditorWidget(
+            self.accent_color,
+            self.accent_color2,
+            self,
+            use_opengl=bool(self.config.get("opengl_viewport", False)),
+        )
         self.block_editor.dirty_changed.connect(self._on_editor_dirty_changed)
         self.block_editor.component_loaded.connect(self._on_component_loaded)
         self.block_editor.set_line_button(self.line_btn)
+        self.line_btn.toggled.connect(self.block_editor.toggle_line_mode)
         editor_layout.addWidget(self.block_editor, 1)
 
         splitter.addWidget(editor_container)
@@ -1523,17 +2236,14 @@ class MainWindow(QtWidgets.QMainWindow):
         add_btn = QtWidgets.QPushButton("Block hinzuf\u00fcgen")
         add_btn.setObjectName("primaryButton")
         add_btn.setCursor(QtCore.Qt.PointingHandCursor)
-        add_btn.clicked.connect(lambda: self._add_block_if_component())
+        add_btn.clicked.connect(self._add_block_if_component)
         header.addWidget(add_btn)
-        self._refresh_library_tree()
 
         return tab
 
     def _build_placeholder_tab(self, text: str) -> QtWidgets.QWidget:
         tab = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(tab)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(10)
+        layout = _vbox(tab, (12, 12, 12, 12), 10)
         label = QtWidgets.QLabel(text)
         label.setObjectName("cardTitle")
         layout.addWidget(label, 0, QtCore.Qt.AlignTop)
@@ -1541,32 +2251,29 @@ class MainWindow(QtWidgets.QMainWindow):
         return tab
 
     def _open_settings_dialog(self) -> None:
+        if self._settings_controller is None:
+            self._settings_controller = self._build_settings_dialog()
+        self._settings_controller.reset()
+        self._settings_controller.dialog.exec()
+
+    def _build_settings_dialog(self) -> SettingsDialogController:
         dlg = QtWidgets.QDialog(self)
         dlg.setWindowTitle("Settings")
         dlg.setMinimumSize(720, 480)
         dlg.setObjectName("background")
 
-        root_layout = QtWidgets.QVBoxLayout(dlg)
-        root_layout.setContentsMargins(0, 0, 0, 0)
-        root_layout.setSpacing(0)
+        root_layout = _vbox(dlg, (0, 0, 0, 0), 0)
 
-        content_layout = QtWidgets.QHBoxLayout()
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
+        content_layout = _hbox(margins=(0, 0, 0, 0), spacing=0)
 
         nav_container = QtWidgets.QFrame()
         nav_container.setObjectName("navContainer")
         nav_container.setFixedWidth(200)
-        nav_layout = QtWidgets.QVBoxLayout(nav_container)
-        nav_layout.setContentsMargins(0, 0, 0, 0)
-        nav_layout.setSpacing(0)
+        nav_layout = _vbox(nav_container, (0, 0, 0, 0), 0)
 
         nav_list = QtWidgets.QListWidget()
         nav_list.setObjectName("navList")
-        nav_list.addItem("Pfade")
-        nav_list.addItem("Design")
-        nav_list.addItem("Libraries")
-        nav_list.setCurrentRow(0)
+        nav_list.addItems(["Pfade", "Design", "Libraries"])
         nav_layout.addWidget(nav_list)
 
         separator = QtWidgets.QFrame()
@@ -1577,9 +2284,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Pfade-Tab
         paths_page = QtWidgets.QWidget()
-        paths_layout = QtWidgets.QVBoxLayout(paths_page)
-        paths_layout.setContentsMargins(16, 16, 16, 16)
-        paths_layout.setSpacing(12)
+        paths_layout = _vbox(paths_page, (16, 16, 16, 16), 12)
 
         info = QtWidgets.QLabel(
             "Passe die Pfade fuer shared und local an. Aenderungen werden gespeichert und direkt angewendet."
@@ -1588,95 +2293,78 @@ class MainWindow(QtWidgets.QMainWindow):
         info.setObjectName("holderLabel")
         paths_layout.addWidget(info)
 
-        shared_input = QtWidgets.QLineEdit(str(self.shared_dir))
+        shared_input = QtWidgets.QLineEdit()
         shared_input.setObjectName("settingsField")
-        local_input = QtWidgets.QLineEdit(str(self.local_dir))
+        local_input = QtWidgets.QLineEdit()
         local_input.setObjectName("settingsField")
-        backup_input = QtWidgets.QLineEdit(str(self.backup_dir) if self.backup_dir else "")
+        backup_input = QtWidgets.QLineEdit()
         backup_input.setObjectName("settingsField")
+        accent_input = QtWidgets.QLineEdit()
+        accent_input.setObjectName("settingsField")
+        accent_input.setPlaceholderText("#rrggbb")
+        dark_radio = QtWidgets.QRadioButton("Dark Mode")
+        light_radio = QtWidgets.QRadioButton("Light Mode")
+        libraries_list = QtWidgets.QListWidget()
+        libraries_list.setObjectName("libraryList")
+        libraries_list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        libraries_list.setEditTriggers(
+            QtWidgets.QAbstractItemView.DoubleClicked | QtWidgets.QAbstractItemView.SelectedClicked
+        )
+        divider = QtWidgets.QFrame()
+        divider.setFrameShape(QtWidgets.QFrame.HLine)
+        divider.setFrameShadow(QtWidgets.QFrame.Plain)
+        divider.setFixedHeight(1)
+        divider.setStyleSheet("border: none;")
 
-        def browse_shared() -> None:
-            path = QtWidgets.QFileDialog.getExistingDirectory(
-                self, "Shared Ordner waehlen", shared_input.text() or str(self.shared_dir)
-            )
-            if path:
-                shared_input.setText(path)
+        controller = SettingsDialogController(
+            self,
+            dlg,
+            shared_input,
+            local_input,
+            backup_input,
+            accent_input,
+            dark_radio,
+            light_radio,
+            libraries_list,
+            divider,
+            nav_list,
+        )
 
-        def browse_local() -> None:
-            path = QtWidgets.QFileDialog.getExistingDirectory(
-                self, "Local Ordner waehlen", local_input.text() or str(self.local_dir)
-            )
-            if path:
-                local_input.setText(path)
-
-        def browse_backup() -> None:
-            start = backup_input.text() or shared_input.text() or str(BASE_DIR)
-            path = QtWidgets.QFileDialog.getExistingDirectory(self, "Backup Ordner waehlen", start)
-            if path:
-                backup_input.setText(path)
-
-        paths_layout.addLayout(self._path_row("Shared Pfad", shared_input, browse_shared))
-        paths_layout.addLayout(self._path_row("Local Pfad", local_input, browse_local))
-        paths_layout.addLayout(self._path_row("Backup Pfad", backup_input, browse_backup))
+        paths_layout.addLayout(self._path_row("Shared Pfad", shared_input, controller.browse_shared))
+        paths_layout.addLayout(self._path_row("Local Pfad", local_input, controller.browse_local))
+        paths_layout.addLayout(self._path_row("Backup Pfad", backup_input, controller.browse_backup))
         paths_layout.addStretch(1)
         stack.addWidget(paths_page)
 
         # Design-Tab
         design_page = QtWidgets.QWidget()
-        design_layout = QtWidgets.QVBoxLayout(design_page)
-        design_layout.setContentsMargins(16, 16, 16, 16)
-        design_layout.setSpacing(12)
+        design_layout = _vbox(design_page, (16, 16, 16, 16), 12)
 
         design_info = QtWidgets.QLabel("Passe die Design-Akzente an. Aenderungen wirken sofort nach dem Speichern.")
         design_info.setWordWrap(True)
         design_info.setObjectName("holderLabel")
         design_layout.addWidget(design_info)
 
-        theme_row = QtWidgets.QHBoxLayout()
-        theme_row.setSpacing(8)
+        theme_row = _hbox(spacing=8)
         theme_label = QtWidgets.QLabel("Modus")
         theme_label.setObjectName("itemName")
         theme_row.addWidget(theme_label)
         theme_group = QtWidgets.QButtonGroup(design_page)
-        dark_radio = QtWidgets.QRadioButton("Dark Mode")
-        light_radio = QtWidgets.QRadioButton("Light Mode")
         theme_group.addButton(dark_radio)
         theme_group.addButton(light_radio)
-        current_theme = self.config.get("theme", "dark")
-        if current_theme == "light":
-            light_radio.setChecked(True)
-        else:
-            dark_radio.setChecked(True)
         theme_row.addWidget(dark_radio)
         theme_row.addWidget(light_radio)
         theme_row.addStretch(1)
         design_layout.addLayout(theme_row)
 
-        accent_row = QtWidgets.QHBoxLayout()
-        accent_row.setSpacing(8)
+        accent_row = _hbox(spacing=8)
         accent_label = QtWidgets.QLabel("Akzentfarbe")
         accent_label.setObjectName("itemName")
-        accent_input = QtWidgets.QLineEdit(self.accent_color or "#007acc")
-        accent_input.setObjectName("settingsField")
-        accent_input.setPlaceholderText("#rrggbb")
         accent_picker = QtWidgets.QPushButton("Farbe...")
         accent_picker.setObjectName("actionButton")
         accent_picker.setCursor(QtCore.Qt.PointingHandCursor)
+        accent_picker.clicked.connect(controller.pick_accent)
 
-        def pick_accent() -> None:
-            color = QtWidgets.QColorDialog.getColor(QtGui.QColor(accent_input.text() or self.accent_color), self)
-            if color.isValid():
-                accent_input.setText(color.name())
-
-        accent_picker.clicked.connect(pick_accent)
-
-        def load_preset(theme_name: str) -> None:
-            preset = self.config.get("presets", {}).get(theme_name, {})
-            if isinstance(preset, dict):
-                accent_input.setText(preset.get("accent", accent_input.text()))
-
-        dark_radio.toggled.connect(lambda checked: load_preset("dark") if checked else None)
-        light_radio.toggled.connect(lambda checked: load_preset("light") if checked else None)
         accent_row.addWidget(accent_label)
         accent_row.addWidget(accent_input, 1)
         accent_row.addWidget(accent_picker)
@@ -1686,50 +2374,27 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Libraries-Tab
         libraries_page = QtWidgets.QWidget()
-        libraries_layout = QtWidgets.QVBoxLayout(libraries_page)
-        libraries_layout.setContentsMargins(16, 16, 16, 16)
-        libraries_layout.setSpacing(12)
+        libraries_layout = _vbox(libraries_page, (16, 16, 16, 16), 12)
 
         libraries_info = QtWidgets.QLabel("Verwalte die Library-Pfade, aus denen Blocks geladen werden.")
         libraries_info.setObjectName("holderLabel")
         libraries_info.setWordWrap(True)
         libraries_layout.addWidget(libraries_info)
 
-        libraries_list = QtWidgets.QListWidget()
-        libraries_list.setObjectName("libraryList")
-        libraries_list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        libraries_list.setEditTriggers(
-            QtWidgets.QAbstractItemView.DoubleClicked | QtWidgets.QAbstractItemView.SelectedClicked
-        )
-        for path in self.library_paths:
-            libraries_list.addItem(path)
         libraries_layout.addWidget(libraries_list, 1)
+        libraries_list.itemChanged.connect(controller.sync_known_library_paths)
 
-        lib_buttons = QtWidgets.QHBoxLayout()
-        lib_buttons.setSpacing(8)
-
-        def add_library_path() -> None:
-            start_dir = self.library_paths[0] if self.library_paths else str(BASE_DIR)
-            path = QtWidgets.QFileDialog.getExistingDirectory(self, "Library-Ordner waehlen", start_dir)
-            if path:
-                items = [libraries_list.item(i).text() for i in range(libraries_list.count())]
-                if path not in items:
-                    libraries_list.addItem(path)
-
-        def remove_library_path() -> None:
-            row = libraries_list.currentRow()
-            if row >= 0:
-                libraries_list.takeItem(row)
+        lib_buttons = _hbox(spacing=8)
 
         add_lib_btn = QtWidgets.QPushButton("Pfad hinzufuegen")
         add_lib_btn.setObjectName("actionButton")
         add_lib_btn.setCursor(QtCore.Qt.PointingHandCursor)
-        add_lib_btn.clicked.connect(add_library_path)
+        add_lib_btn.clicked.connect(controller.add_library_path)
 
         remove_lib_btn = QtWidgets.QPushButton("Entfernen")
         remove_lib_btn.setObjectName("dangerButton")
         remove_lib_btn.setCursor(QtCore.Qt.PointingHandCursor)
-        remove_lib_btn.clicked.connect(remove_library_path)
+        remove_lib_btn.clicked.connect(controller.remove_library_path)
 
         lib_buttons.addWidget(add_lib_btn)
         lib_buttons.addWidget(remove_lib_btn)
@@ -1743,17 +2408,9 @@ class MainWindow(QtWidgets.QMainWindow):
         content_layout.addWidget(separator)
         content_layout.addWidget(stack, 1)
         root_layout.addLayout(content_layout, 1)
-
-        divider = QtWidgets.QFrame()
-        divider.setFrameShape(QtWidgets.QFrame.HLine)
-        divider.setFrameShadow(QtWidgets.QFrame.Plain)
-        divider.setFixedHeight(1)
-        divider.setStyleSheet("border: none;")
         root_layout.addWidget(divider)
 
-        btn_row = QtWidgets.QHBoxLayout()
-        btn_row.setContentsMargins(16, 12, 16, 12)
-        btn_row.setSpacing(8)
+        btn_row = _hbox(margins=(16, 12, 16, 12), spacing=8)
         btn_row.addStretch(1)
         cancel_btn = QtWidgets.QPushButton("Abbrechen")
         cancel_btn.setObjectName("actionButton")
@@ -1762,40 +2419,22 @@ class MainWindow(QtWidgets.QMainWindow):
         save_btn = QtWidgets.QPushButton("Speichern und neu laden")
         save_btn.setObjectName("primaryButton")
         save_btn.setCursor(QtCore.Qt.PointingHandCursor)
-        save_btn.clicked.connect(
-            lambda: self._apply_settings(
-                shared_input.text().strip(),
-                local_input.text().strip(),
-                backup_input.text().strip(),
-                dlg,
-                accent_input.text().strip(),
-                "light" if light_radio.isChecked() else "dark",
-                [
-                    libraries_list.item(i).text().strip()
-                    for i in range(libraries_list.count())
-                    if libraries_list.item(i).text().strip()
-                ],
-            )
-        )
+        save_btn.clicked.connect(controller.save)
         btn_row.addWidget(cancel_btn)
         btn_row.addWidget(save_btn)
         root_layout.addLayout(btn_row)
 
-        def apply_dialog_theme() -> None:
-            theme_name = "light" if light_radio.isChecked() else "dark"
-            dialog_colors = self._current_colors(theme_override=theme_name)
-            dlg.setStyleSheet(self._build_stylesheet(dialog_colors))
-            divider.setStyleSheet(f"background: {dialog_colors['border']}; border: none;")
-
-        dark_radio.toggled.connect(lambda checked: apply_dialog_theme() if checked else None)
-        light_radio.toggled.connect(lambda checked: apply_dialog_theme() if checked else None)
-        apply_dialog_theme()
+        dark_radio.toggled.connect(controller.on_dark_toggled)
+        light_radio.toggled.connect(controller.on_light_toggled)
+        return controller
 
-        dlg.exec()
+    @staticmethod
+    def _collect_library_paths(libraries_list: QtWidgets.QListWidget) -> list[str]:
+        texts = [libraries_list.item(i).text().strip() for i in range(libraries_list.count())]
+        return [t for t in texts if t]
 
     def _path_row(self, label_text: str, line_edit: QtWidgets.QLineEdit, handler) -> QtWidgets.QHBoxLayout:
-        row = QtWidgets.QHBoxLayout()
-        row.setSpacing(8)
+        row = _hbox(spacing=8)
         label = QtWidgets.QLabel(label_text)
         label.setObjectName("itemName")
         browse = QtWidgets.QPushButton("...")
@@ -1808,84 +2447,15 @@ class MainWindow(QtWidgets.QMainWindow):
         return row
 
     def _show_about_dialog(self) -> None:
-        qt_version = getattr(QtCore, "QT_VERSION_STR", None) or QtCore.qVersion()
-
-        class AboutDialog(QtWidgets.QDialog):
-            def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
-                super().__init__(parent)
-                self.setWindowFlags(QtCore.Qt.FramelessWindowHint | QtCore.Qt.Dialog)
-                self.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
-                self._drag_pos: QtCore.QPoint | None = None
-
-            def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
-                if event.button() == QtCore.Qt.LeftButton:
-                    self._drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
-                    event.accept()
-                    return
-                super().mousePressEvent(event)
-
-            def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:
-                if event.buttons() & QtCore.Qt.LeftButton and self._drag_pos is not None:
-                    self.move(event.globalPosition().toPoint() - self._drag_pos)
-                    event.accept()
-                    return
-                super().mouseMoveEvent(event)
-
-            def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
-                self._drag_pos = None
-                super().mouseReleaseEvent(event)
-
-        dlg = AboutDialog(self)
-        dlg.setObjectName("aboutDialog")
-        dlg.setFixedSize(420, 240)
-        dlg.setStyleSheet(self._build_stylesheet(self._current_colors()))
-
-        outer = QtWidgets.QVBoxLayout(dlg)
-        outer.setContentsMargins(10, 10, 10, 10)
-        outer.setSpacing(0)
-
-        shell = QtWidgets.QFrame()
-        shell.setObjectName("aboutShell")
-        shell_layout = QtWidgets.QVBoxLayout(shell)
-        shell_layout.setContentsMargins(16, 14, 16, 14)
-        shell_layout.setSpacing(10)
-
-        header = QtWidgets.QHBoxLayout()
-        header.setSpacing(8)
-        header_title = QtWidgets.QLabel("About Neuranel")
-        header_title.setObjectName("cardTitle")
-        header.addWidget(header_title)
-        header.addStretch(1)
-        close_icon = QtWidgets.QToolButton()
-        close_icon.setText("×")
-        close_icon.setObjectName("aboutCloseButton")
-        close_icon.setCursor(QtCore.Qt.PointingHandCursor)
-        close_icon.clicked.connect(dlg.reject)
-        header.addWidget(close_icon)
-        shell_layout.addLayout(header)
-
-        version_label = QtWidgets.QLabel(f"Suite Version: {self._suite_version}")
-        version_label.setObjectName("holderLabel")
-        shell_layout.addWidget(version_label)
-
-        info_text = QtWidgets.QLabel(
-            f"Benutzer: {getuser()}\nProject Manager: {self._pm_version}\nQt: {qt_version}\nSupport: e.seidner@duschek-haustechnik.at"
+        dlg = self._about_dialog
+        if dlg is None:
+            dlg = AboutDialog(self)
+            self._about_dialog = dlg
+        dlg.setStyleSheet(self._get_current_stylesheet())
+        dlg.version_label.setText(f"Suite Version: {self._suite_version}")
+        dlg.info_text.setText(
+            f"Benutzer: {getuser()}\nProject Manager: {self._pm_version}\nQt: {self._qt_version_str}\nSupport: e.seidner@duschek-haustechnik.at"
         )
-        info_text.setObjectName("aboutInfo")
-        info_text.setWordWrap(True)
-        shell_layout.addWidget(info_text, 1)
-
-        close_btn = QtWidgets.QPushButton("Schließen")
-        close_btn.setObjectName("actionButton")
-        close_btn.setCursor(QtCore.Qt.PointingHandCursor)
-        close_btn.clicked.connect(dlg.accept)
-        btn_row = QtWidgets.QHBoxLayout()
-        btn_row.addStretch(1)
-        btn_row.addWidget(close_btn)
-        shell_layout.addLayout(btn_row)
-
-        outer.addWidget(shell, 1)
-
         dlg.exec()
 
     def _show_timed_info(self, title: str, message: str, *, timeout_ms: int = 2000) -> None:
@@ -1896,7 +2466,7 @@ class MainWindow(QtWidgets.QMainWindow):
         box.setStandardButtons(QtWidgets.QMessageBox.NoButton)
         box.setWindowModality(QtCore.Qt.NonModal)
         box.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
-        box.setStyleSheet(self._build_stylesheet(self._current_colors()))
+        box.setStyleSheet(self._get_current_stylesheet())
         box.open()
         QtCore.QTimer.singleShot(timeout_ms, box.accept)
 
@@ -1910,6 +2480,14 @@ class MainWindow(QtWidgets.QMainWindow):
         theme_value: str | None = None,
         library_paths: list[str] | None = None,
     ) -> None:
+        old_state = (
+            self.shared_dir,
+            self.local_dir,
+            self.backup_dir,
+            self.theme,
+            (self.accent_color or "").lower(),
+            tuple(self.library_paths),
+        )
         new_common = self._normalize_path(shared_value, self.shared_dir)
         new_local = self._normalize_path(local_value, self.local_dir)
         new_backup = self._normalize_path(backup_value, self.backup_dir or BASE_DIR / "backups")
@@ -1918,29 +2496,45 @@ class MainWindow(QtWidgets.QMainWindow):
         self.backup_dir = new_backup
         self.loans_file = self.shared_dir / "neuranel_data" / "loans.json"
         self.local_loans_file = self.local_dir / "neuranel_data" / "loans_local.json"
-        self.config["shared_dir"] = str(self.shared_dir)
-        self.config["local_dir"] = str(self.local_dir)
-        self.config["backup_dir"] = str(self.backup_dir) if self.backup_dir else ""
-        if library_paths is not None:
+        cfg = self.config
+        cfg["shared_dir"] = str(self.shared_dir)
+        cfg["local_dir"] = str(self.local_dir)
+        cfg["backup_dir"] = str(self.backup_dir) if self.backup_dir else ""
+        self._colors_cache.clear()
+        if library_paths is not None and library_paths != self.library_paths:
             self._set_library_paths(library_paths)
         else:
-            self.config["libraries"] = self.library_paths
+            cfg["libraries"] = self.library_paths
         if theme_value:
-            self.config["theme"] = theme_value
+            cfg["theme"] = theme_value
             self.theme = theme_value
-            self.accent_color = self._current_colors().get("accent", self.accent_color)
-            self.accent_color2 = self._current_colors().get("accent2", self.accent_color2)
+            colors = self._current_colors()
+            self.accent_color = colors.get("accent", self.accent_color)
+            self.accent_color2 = colors.get("accent2", self.accent_color2)
         if accent_value:
             color = QtGui.QColor(accent_value)
             if color.isValid():
                 self.accent_color = color.name()
-                self.config.setdefault("presets", {}).setdefault(self.theme, {})["accent"] = self.accent_color
-                self.config["accent_color"] = self.accent_color
+                cfg.setdefault("presets", {}).setdefault(self.theme, {})["accent"] = self.accent_color
+                cfg["accent_color"] = self.accent_color
         else:
-            self.config["accent_color"] = self.accent_color
-        self._apply_styles()
-        save_config(self.config)
-        self.refresh_lists()
+            cfg["accent_color"] = self.accent_color
+        new_state = (
+            self.shared_dir,
+            self.local_dir,
+            self.backup_dir,
+            self.theme,
+            (self.accent_color or "").lower(),
+            tuple(self.library_paths),
+        )
+        if new_state != old_state:
+            if new_state[3:5] != old_state[3:5]:
+                self._cached_stylesheet = None
+                self._cached_stylesheet_theme = None
+                self._apply_styles()
+            save_config(cfg)
+            if new_state[:2] != old_state[:2]:
+                self.refresh_lists()
         if dialog:
             dialog.accept()
         self._nav_ignore_enter = True
@@ -1948,17 +2542,23 @@ class MainWindow(QtWidgets.QMainWindow):
         self._show_timed_info("Gespeichert", "Einstellungen gespeichert.", timeout_ms=2000)
 
     def _set_library_paths(self, paths: list[str]) -> None:
-        cleaned: list[str] = []
+        seen: dict[str, None] = {}
         for entry in paths:
             if not isinstance(entry, str):
                 continue
             value = entry.strip()
-            if value and value not in cleaned:
-                cleaned.append(value)
-        self.library_paths = cleaned
+            if value:
+                seen.setdefault(value, None)
+        cleaned = list(seen)
         self.config["libraries"] = cleaned
-        if hasattr(self, "library_tree"):
-            self._refresh_library_tree()
+        if cleaned == self.library_paths:
+            return
+        self.library_paths = cleaned
+        if self.library_tree is not None:
+            if self.library_tree.isVisible():
+                self._refresh_library_tree()
+            else:
+                self._library_tree_loaded = False
 
     def _setup_palette(self) -> None:
         palette = self.palette()
@@ -1967,6 +2567,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setPalette(palette)
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _shade(hex_color: str, factor: int) -> str:
         color = QtGui.QColor(hex_color)
         if not color.isValid():
@@ -1984,15 +2585,28 @@ class MainWindow(QtWidgets.QMainWindow):
         return layout
 
     def _current_colors(self, theme_override: str | None = None) -> dict[str, str]:
-        presets = self.config.get("presets", {})
-        theme = theme_override or self.config.get("theme", "dark")
-        base = presets.get(theme) or presets.get("dark") or DEFAULT_PRESETS["dark"]
+        cfg = self.config
+        presets = cfg.get("presets", {})
+        dark_defaults = DEFAULT_PRESETS["dark"]
+        theme = theme_override or cfg.get("theme", "dark")
+        base = presets.get(theme) or presets.get("dark") or dark_defaults
+        cache_key = (
+            theme,
+            base.get("accent"),
+            base.get("accent2"),
+            base.get("bg1"),
+            base.get("bg2"),
+            base.get("bg3"),
+        )
+        cached = self._colors_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
         colors = {
-            "bg1": base.get("bg1", DEFAULT_PRESETS["dark"]["bg1"]),
-            "bg2": base.get("bg2", DEFAULT_PRESETS["dark"]["bg2"]),
-            "bg3": base.get("bg3", DEFAULT_PRESETS["dark"]["bg3"]),
-            "accent": base.get("accent", DEFAULT_PRESETS["dark"]["accent"]),
-            "accent2": base.get("accent2", DEFAULT_PRESETS["dark"]["accent2"]),
+            "bg1": base.get("bg1", dark_defaults["bg1"]),
+            "bg2": base.get("bg2", dark_defaults["bg2"]),
+            "bg3": base.get("bg3", dark_defaults["bg3"]),
+            "accent": base.get("accent", dark_defaults["accent"]),
+            "accent2": base.get("accent2", dark_defaults["accent2"]),
             "theme": theme,
         }
         colors["hover"] = self._shade(colors["bg1"], 130)
@@ -2027,374 +2641,156 @@ class MainWindow(QtWidgets.QMainWindow):
             colors["nav_hover"] = colors["hover"]
             colors["project_item_bg"] = colors["bg3"]
             colors["project_item_hover"] = self._shade(colors["bg3"], 125)
-        return colors
+        self._colors_cache[cache_key] = colors
+        return dict(colors)
 
     def _build_stylesheet(self, colors: dict[str, str]) -> str:
-        accent = colors["accent"]
-        replacements = {
-            "{bg1}": colors["bg1"],
-            "{bg2}": colors["bg2"],
-            "{bg3}": colors["bg3"],
-            "{hover}": colors["hover"],
-            "{border}": colors["border"],
-            "{border_alt}": colors["border_alt"],
-            "{accent}": accent,
-            "{accent2}": colors["accent2"],
-            "{accent_hover}": colors["accent_hover"],
-            "{accent_pressed}": colors["accent_pressed"],
-            "{text_primary}": colors["text_primary"],
-            "{text_muted}": colors["text_muted"],
-            "{titlebar_bg}": colors["titlebar_bg"],
-            "{titlebar_text}": colors["titlebar_text"],
-            "{titlebar_hover}": colors["titlebar_hover"],
-            "{nav_bg}": colors["nav_bg"],
-            "{nav_text}": colors["nav_text"],
-            "{nav_hover}": colors["nav_hover"],
-            "{project_item_bg}": colors["project_item_bg"],
-            "{project_item_hover}": colors["project_item_hover"],
-        }
-        stylesheet = """
-            #background {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {bg2}, stop:1 {bg2});
-            }
-            #titleBar {
-                background: {titlebar_bg};
-                border: none;
-                border-bottom: 1px solid {border};
-            }
-            #titleBarLogo { margin: 0; padding: 0; }
-            QToolButton#titleBarButton,
-            QToolButton#closeButton {
-                background: transparent;
-                color: {titlebar_text};
-                border: none;
-                border-radius: 0;
-                padding: 0;
-                margin: 0;
-                min-width: 37px;
-                max-width: 37px;
-                min-height: 31px;
-                max-height: 31px;
-            }
-            #settingsButton {
-                background: transparent;
-                color: {titlebar_text};
-                border: none;
-                padding: 0 4px;
-                font: 12px "Segoe UI";
-            }
-            #settingsButton:hover { background: {titlebar_hover}; color: #ffffff; }
-            #settingsButton:pressed { background: {titlebar_bg}; }
-            QToolButton#titleBarButton:hover { background: {titlebar_hover}; }
-            QToolButton#titleBarButton:pressed { background: {titlebar_bg}; }
-            QToolButton#closeButton { background: transparent; border: none; }
-            QToolButton#closeButton:hover { background: #b31b1b; color: #ffffff; }
-            QToolButton#closeButton:pressed { background: #8a1111; }
-            #navContainer {
-                background: {nav_bg};
-                border-right: 1px solid {border};
-            }
-            #navOverlay {
-                background: {nav_bg};
-                border-right: 1px solid {border};
-            }
-            #navSeparator {
-                background: {border};
-            }
-            #navList {
-                background: {nav_bg};
-                border: none;
-                color: {nav_text};
-                font: 12px "Segoe UI";
-                outline: none;
-            }
-            #navList::item {
-                padding: 8px 6px;
-                margin: 1px 0;
-            }
-            #navList::item:selected {
-                background: transparent;
-                color: {nav_text};
-                border-left: 3px solid {accent};
-                padding-left: 9px;
-            }
-            #navList::item:hover {
-                background: {nav_hover};
-            }
-            QMenu {
-                background: {bg3};
-                color: {text_primary};
-                border: 1px solid {border};
-                border-radius: 10px;
-                padding: 4px;
-            }
-            QMenu[menuRole="top"]::right-arrow {
-                image: none;
-                width: 0px;
-                height: 0px;
-            }
-            QMenu::item {
-                padding: 8px 12px;
-                border-radius: 8px;
-            }
-            QMenu::item:selected {
-                background: {nav_hover};
-                color: {text_primary};
-            }
-            QToolButton#settingsButton::menu-indicator { image: none; width: 0px; height: 0px; }
-            QRadioButton { color: {text_primary}; }
-            QCheckBox { color: {text_primary}; }
-            QLineEdit#settingsField {
-                background: {bg3};
-                border: 1px solid {border_alt};
-                color: {text_primary};
-                border-radius: 8px;
-                padding: 6px 10px;
-                min-height: 26px;
-            }
-            QLineEdit#settingsField:focus { border: 1px solid {accent}; }
-            #bottomBar {
-                background: {bg1};
-                border-top: 1px solid {border};
-            }
-            QTabWidget::tab-bar {
-                background: {bg1};
-                padding: 6px 10px;
-                border: 1px solid {border};
-                border-radius: 8px;
-            }
-            QTabWidget::pane { border: none; top: 0px; }
-            QTabBar::tab {
-                background: transparent;
-                padding: 10px 14px;
-                font: 600 13px "Segoe UI";
-                color: {text_muted};
-                margin-right: 4px;
-                border-radius: 6px 6px 0 0;
-                border-top: 2px solid transparent;
-                border-bottom: 0;
-            }
-            QTabBar::tab:selected {
-                color: {text_primary};
-                background: {bg1};
-                border: none;
-                border-top: 4px solid {accent};
-                margin-bottom: 0;
-                border-radius: 0;
-            }
-            QTabBar::tab:hover { color: {text_primary}; }
-            #heroTitle {
-                color: {text_primary};
-                font: 600 24px "Segoe UI";
-                letter-spacing: 0.4px;
-            }
-            #footer {
-                color: {text_muted};
-                font: 11px "Segoe UI";
-            }
-            #card {
-                background: {bg3};
-                border: 1px solid {border_alt};
-                border-radius: 14px;
-            }
-            #libraryPanel {
-                background: {bg3};
-                border: 1px solid {border_alt};
-                border-radius: 12px;
-            }
-            #libraryTree {
-                background: transparent;
-                border: none;
-                color: {text_primary};
-                font: 12px "Consolas";
-            }
-            #libraryTree::item { padding: 4px 6px; margin: 1px 0; }
-            #libraryTree::item:selected { background: {hover}; color: {text_primary}; }
-            QSplitter#blockSplitter::handle { background: {border}; }
-            #blockPaletteBar {
-                background: {bg1};
-                border-bottom: 1px solid {border};
-            }
-            #cardTitle {
-                color: {text_primary};
-                font: 600 16px "Segoe UI";
-            }
-            #projectList {
-                background: transparent;
-                border: none;
-                color: {text_primary};
-                font: 13px "Consolas";
-                outline: none;
-            }
-            #projectList::item { margin: 6px 4px; }
-            #projectList::item:selected { background: transparent; }
-            #projectList::item:hover { background: transparent; }
-            QWidget#projectItem {
-                background: {project_item_bg};
-                border: 1px solid {border_alt};
-                border-radius: 12px;
-            }
-            QWidget#projectItem:hover { background: {project_item_hover}; }
-            #libraryList {
-                background: {bg3};
-                border: 1px solid {border_alt};
-                color: {text_primary};
-                font: 12px "Consolas";
-            }
-            #libraryList::item { padding: 6px 6px; }
-            #libraryList::item:selected { background: {hover}; }
-            #aboutShell {
-                background: {bg3};
-                border: 1px solid {border};
-                border-radius: 14px;
-            }
-            #aboutShell QLabel {
-                color: {text_primary};
-            }
-            #aboutShell QLabel#holderLabel {
-                color: {text_muted};
-            }
-            #aboutInfo {
-                font: 500 12px "Segoe UI";
-            }
-            #aboutCloseButton {
-                background: transparent;
-                color: {text_primary};
-                border: none;
-                font: 600 16px "Segoe UI";
-                padding: 0 6px;
-                min-width: 28px;
-                min-height: 28px;
-            }
-            #aboutCloseButton:hover { background: {hover}; border-radius: 8px; }
-            #coachOverlay { background: transparent; }
-            #coachCard {
-                background: {bg3};
-                border: 1px solid {border};
-                border-radius: 14px;
-            }
-            #coachTitle { color: {text_primary}; font: 650 14px "Segoe UI"; }
-            #coachBody { color: {text_primary}; font: 12px "Segoe UI"; }
-            #primaryButton {
-                background: {accent};
-                color: #ffffff;
-                border: none;
-                border-radius: 12px;
-                padding: 10px 18px;
-                font: 600 13px "Segoe UI";
-            }
-            #primaryButton:hover { background: {accent_hover}; }
-            #primaryButton:pressed { background: {accent_pressed}; }
-            #actionButton {
-                background: #0dbc79;
-                color: #ffffff;
-                border: none;
-                border-radius: 10px;
-                padding: 8px 12px;
-                font: 600 12px "Segoe UI";
-            }
-            #actionButton:hover { background: #10a36f; }
-            #actionButton:pressed { background: #0b7d59; }
-            #secondaryButton {
-                background: {bg2};
-                color: {text_primary};
-                border: 1px solid {border_alt};
-                border-radius: 10px;
-                padding: 8px 12px;
-                font: 600 12px "Segoe UI";
-            }
-            #secondaryButton:hover { background: {hover}; }
-            #secondaryButton:pressed { background: {bg1}; }
-            #dangerButton {
-                background: #f14c4c;
-                color: #ffffff;
-                border: none;
-                border-radius: 10px;
-                padding: 8px 12px;
-                font: 600 12px "Segoe UI";
-            }
-            #dangerButton:hover { background: #f0626c; }
-            #dangerButton:pressed { background: #b31b1b; }
-            #itemName { font: 600 13px "Segoe UI"; color: {text_primary}; }
-            #holderLabel { font: 11px "Segoe UI"; color: {text_muted}; }
-            #searchField {
-                background: {bg3};
-                border: 1px solid {border_alt};
-                color: {text_primary};
-                border-radius: 6px;
-                padding: 6px 10px;
-                font: 12px "Segoe UI";
-            }
-            #searchField:focus { border: 1px solid {accent}; }
-            """
-        for key, value in replacements.items():
-            stylesheet = stylesheet.replace(key, value)
-        return stylesheet
+        return _render_stylesheet(tuple((key, colors[key]) for key in _STYLESHEET_KEYS))
+
+    def _get_current_stylesheet(self) -> str:
+        if self._cached_stylesheet is None or self._cached_stylesheet_theme != self.theme:
+            self._cached_stylesheet = self._build_stylesheet(self._current_colors())
+            self._cached_stylesheet_theme = self.theme
+        return self._cached_stylesheet
 
     def _apply_styles(self) -> None:
         colors = self._current_colors()
         accent = colors["accent"]
         self.accent_color = accent
         self.accent_color2 = colors["accent2"]
-        self.setStyleSheet(self._build_stylesheet(colors))
+        stylesheet = self._build_stylesheet(colors)
+        self._cached_stylesheet = stylesheet
+        self._cached_stylesheet_theme = self.theme
+        if stylesheet != self._applied_stylesheet:
+            self.setStyleSheet(stylesheet)
+            self._applied_stylesheet = stylesheet
         self._refresh_nav_icons()
-        if hasattr(self, "block_editor"):
+        if self.block_editor is not None:
             self.block_editor.set_accent(accent, self.accent_color2)
-        if hasattr(self, "library_tree"):
-            self.library_tree.update_theme(self._current_colors())
+        if self.library_tree is not None:
+            self.library_tree.update_theme(colors)
+        if self._onboarding_overlay is not None:
+            self._onboarding_overlay.set_theme(colors)
 
     def _refresh_library_tree(self) -> None:
-        if not hasattr(self, "library_tree"):
+        if self.library_tree is None:
             return
-        self.library_tree.clear()
+        self._library_tree_loaded = True
+        tree = self.library_tree
         if not self.library_paths:
+            tree.clear()
+            self._library_items.clear()
             placeholder = QtWidgets.QTreeWidgetItem(["Keine Library eingetragen"])
             placeholder.setFlags(QtCore.Qt.ItemIsEnabled)
-            self.library_tree.addTopLevelItem(placeholder)
-            return
-        for lib_path in self.library_paths:
-            path_obj = Path(lib_path).expanduser()
-            root = QtWidgets.QTreeWidgetItem([path_obj.name or str(path_obj)])
-            root.setToolTip(0, str(path_obj))
-            root.setData(0, QtCore.Qt.UserRole, str(path_obj))
-            if not path_obj.exists():
+            tree.addTopLevelItem(placeholder)
+            return
+        wanted = {str(Path(lib_path).expanduser()): Path(lib_path).expanduser() for lib_path in self.library_paths}
+        for key in [key for key in self._library_items if key not in wanted]:
+            item = self._library_items.pop(key)
+            tree.takeTopLevelItem(tree.indexOfTopLevelItem(item))
+        known = set(map(id, self._library_items.values()))
+        for index in reversed(range(tree.topLevelItemCount())):
+            if id(tree.topLevelItem(index)) not in known:
+                tree.takeTopLevelItem(index)
+        for index, (key, path_obj) in enumerate(wanted.items()):
+            root = self._library_items.get(key)
+            is_new = root is None
+            if is_new:
+                root = QtWidgets.QTreeWidgetItem([path_obj.name or str(path_obj)])
+                root.setToolTip(0, key)
+                root.setData(0, QtCore.Qt.UserRole, key)
+                self._library_items[key] = root
+            if path_obj.exists():
+                root.setData(0, QtCore.Qt.ForegroundRole, None)
+            else:
                 root.setForeground(0, QtGui.QBrush(QtGui.QColor("#f14c4c")))
-            self._populate_library_dir(root, path_obj, 0)
-            self.library_tree.addTopLevelItem(root)
-        self.library_tree.expandToDepth(1)
+            self._populate_library_dir(root, path_obj, 0, self._is_basic_path(path_obj))
+            current = tree.indexOfTopLevelItem(root)
+            if current != index:
+                if current >= 0:
+                    tree.takeTopLevelItem(current)
+                tree.insertTopLevelItem(index, root)
+            if is_new:
+                root.setExpanded(True)
+                for i in range(root.childCount()):
+                    child = root.child(i)
+                    if child.data(0, QtCore.Qt.UserRole + 3):
+                        child.setExpanded(True)
 
     def _is_basic_item(self, item: QtWidgets.QTreeWidgetItem, path_obj: Path) -> bool:
         return self._is_basic_path(path_obj) or str(item.data(0, QtCore.Qt.UserRole + 1) or "").lower() == "basic"
 
     @staticmethod
     def _is_basic_path(path_obj: Path) -> bool:
-        return "basic" in [p.lower() for p in path_obj.parts]
+        return any(part.lower() == "basic" for part in path_obj.parts)
 
-    def _populate_library_dir(self, parent_item: QtWidgets.QTreeWidgetItem, path: Path, depth: int) -> None:
+    def _populate_library_dir(
+        self, parent_item: QtWidgets.QTreeWidgetItem, path: Path, depth: int, parent_is_basic: bool = False
+    ) -> None:
         if depth > 4:
             return
-        if not path.exists() or not path.is_dir():
-            return
         try:
-            children = sorted(path.iterdir(), key=lambda p: (p.is_file(), p.name.lower()))
+            path_stat = path.stat()
+            if not stat.S_ISDIR(path_stat.st_mode):
+                parent_item.takeChildren()
+                return
+            children = _list_dir_cached(str(path), path_stat.st_mtime_ns)
         except OSError:
+            # A vanished or unreadable folder must not keep draggable children from the last refresh.
+            parent_item.takeChildren()
             return
-        for child in children:
+        # Sync against the existing children so unchanged items (and their expansion) survive a refresh.
+        existing: dict[tuple[str, bool], QtWidgets.QTreeWidgetItem] = {}
+        for i in reversed(range(parent_item.childCount())):
+            old = parent_item.child(i)
+            key = old.data(0, QtCore.Qt.UserRole)
+            if key:
+                existing[(str(key), bool(old.data(0, QtCore.Qt.UserRole + 3)))] = old
+            else:
+                parent_item.removeChild(old)
+        ordered: list[QtWidgets.QTreeWidgetItem] = []
+        for name, is_file, is_dir in children:
+            child = path / name
+            is_basic_path = parent_is_basic or name.lower() == "basic"
+            item = existing.pop((str(child), is_dir), None)
+            if item is not None:
+                if is_dir and item.data(0, QtCore.Qt.UserRole + 2) is None:
+                    self._populate_library_dir(item, child, depth + 1, is_basic_path)
+                ordered.append(item)
+                continue
             item = QtWidgets.QTreeWidgetItem([child.name])
             item.setToolTip(0, str(child))
             item.setData(0, QtCore.Qt.UserRole, str(child))
-            is_basic_path = self._is_basic_path(child)
+            item.setData(0, QtCore.Qt.UserRole + 3, is_dir)
             if is_basic_path:
                 item.setData(0, QtCore.Qt.UserRole + 1, "basic")
             flags = item.flags()
-            if child.is_file() and not is_basic_path:
+            if is_file and not is_basic_path:
                 item.setFlags(flags & ~QtCore.Qt.ItemIsDragEnabled)
-            parent_item.addChild(item)
-            if child.is_dir():
-                if child.name.lower() == "basic":
+            if is_dir:
+                if name.lower() == "basic":
                     item.setData(0, QtCore.Qt.UserRole + 1, "basic_folder")
-                self._populate_library_dir(item, child, depth + 1)
+                if depth < 1:
+                    # Roots are shown expanded to depth 1, so fill that level right away.
+                    self._populate_library_dir(item, child, depth + 1, is_basic_path)
+                elif depth < 4:
+                    item.setData(0, QtCore.Qt.UserRole + 2, depth + 1)
+                    item.addChild(QtWidgets.QTreeWidgetItem(["..."]))
+            ordered.append(item)
+        for old in existing.values():
+            parent_item.removeChild(old)
+        for index, item in enumerate(ordered):
+            if parent_item.child(index) is not item:
+                parent_item.insertChild(index, item)
+
+    def _on_library_item_expanded(self, item: QtWidgets.QTreeWidgetItem) -> None:
+        depth = item.data(0, QtCore.Qt.UserRole + 2)
+        if depth is None:
+            return
+        item.setData(0, QtCore.Qt.UserRole + 2, None)
+        item.takeChildren()
+        is_basic = item.data(0, QtCore.Qt.UserRole + 1) in ("basic", "basic_folder")
+        self._populate_library_dir(item, Path(str(item.data(0, QtCore.Qt.UserRole))), int(depth), is_basic)
 
     def _on_library_context_menu(self, pos: QtCore.QPoint) -> None:
         item = self.library_tree.itemAt(pos)
@@ -2418,142 +2814,279 @@ class MainWindow(QtWidgets.QMainWindow):
         if not menu.isEmpty():
             menu.exec(self.library_tree.viewport().mapToGlobal(pos))
 
+    def _set_loans(self, loans: dict) -> None:
+        self.loans = loans
+        self._loans_flat = {
+            name: (info.get("holder"), info.get("timestamp")) if isinstance(info, dict) else (None, None)
+            for name, info in (loans.items() if isinstance(loans, dict) else ())
+        }
+
     def _set_status(self, text: str) -> None:
-        if hasattr(self, "status_label") and self.status_label:
+        if self.status_label is not None:
             self.status_label.setText(text)
 
     def refresh_lists(self, *, show_loading: bool = False, force: bool = False) -> None:
         if show_loading:
             self._set_status("Laden ...")
-            QtWidgets.QApplication.processEvents(QtCore.QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
-        try:
+        # Stats, loan parsing and listings run on the thread pool; only the diff/fill touches the UI.
+        self._refresh_generation += 1
+        generation = self._refresh_generation
+        self._pending_force |= force
+        force = self._pending_force
+        loans_file = self.loans_file
+        shared_dir = self.shared_dir
+        local_dir = self.local_dir
+        mtime_paths = (loans_file, loans_file.parent, shared_dir, local_dir, self.local_loans_file)
+        last_mtimes = None if force else self._last_mtimes
+
+        def load() -> tuple:
+            # Directory and loan-file mtimes are a cheap change signal; skip the listing when none moved.
+            mtimes = self._refresh_mtimes(mtime_paths)
+            if mtimes == last_mtimes:
+                return mtimes, None
             try:
-                new_loans = load_loans(self.loans_file)
+                loans = load_loans(loans_file)
             except Exception:
-                new_loans = self._last_loans or {}
-            new_shared = [
-                name for name in list_projects(self.shared_dir) if name.lower() != "neuranel_data"
-            ]
-            new_local = [name for name in list_projects(self.local_dir) if name.lower() != "neuranel_data"]
-            self._refresh_local_borrowed(new_local)
-
-            if (
-                not force
-                and new_loans == self._last_loans
-                and new_shared == self._last_shared
-                and new_local == self._last_local
-            ):
-                return
+                loans = None
+            shared = [name for name in list_projects(shared_dir) if name.lower() != "neuranel_data"]
+            local = [name for name in list_projects(local_dir) if name.lower() != "neuranel_data"]
+            return mtimes, (loans, shared, local)
+
+        task = TaskRunnable(load)
+        task.signals.finished.connect(
+            partial(self._on_lists_loaded, task, generation, show_loading), QtCore.Qt.QueuedConnection
+        )
+        task.signals.failed.connect(
+            partial(self._on_lists_failed, task, generation, show_loading), QtCore.Qt.QueuedConnection
+        )
+        self._refresh_tasks.add(task)
+        QtCore.QThreadPool.globalInstance().start(task)
 
-            self.loans = new_loans
-            self._shared_all = new_shared
-            self._local_all = new_local
-            self._apply_shared_filter()
-            self._apply_local_filter()
-            self._update_title_local_list()
-            self._last_loans = new_loans
-            self._last_shared = new_shared
-            self._last_local = new_local
-
-            missing = []
-            if not self.shared_dir.exists():
-                missing.append(f"Ordner fehlt: {self.shared_dir}")
-            if not self.local_dir.exists():
-                missing.append(f"Ordner fehlt: {self.local_dir}")
-            if missing:
-                QtWidgets.QMessageBox.warning(self, "Ordner fehlt", "\n".join(missing))
+    def _on_lists_failed(self, task: TaskRunnable, generation: int, show_loading: bool, _message: str) -> None:
+        self._refresh_tasks.discard(task)
+        if generation != self._refresh_generation:
+            return
+        if show_loading:
+            self._set_status("")
+        self._release_transfer_busy()
+
+    def _on_lists_loaded(
+        self, task: TaskRunnable, generation: int, show_loading: bool, result: tuple
+    ) -> None:
+        self._refresh_tasks.discard(task)
+        if generation != self._refresh_generation:
+            return
+        if show_loading:
+            self._set_status("")
+        try:
+            self._apply_lists(result)
         finally:
-            if show_loading:
-                self._set_status("")
+            self._release_transfer_busy()
+
+    def _release_transfer_busy(self) -> None:
+        if not self._awaiting_lists:
+            return
+        self._awaiting_lists = False
+        self._busy = False
+        self._set_buttons_enabled(True)
+
+    def _apply_lists(self, result: tuple) -> None:
+        force = self._pending_force
+        self._pending_force = False
+        mtimes, data = result
+        self._last_mtimes = mtimes
+        if data is None:
+            return
+        new_loans, new_shared, new_local = data
+        if new_loans is None:
+            new_loans = self._last_loans or {}
+        self._refresh_local_borrowed(new_local)
+
+        if (
+            not force
+            and new_loans == self._last_loans
+            and new_shared == self._last_shared
+            and new_local == self._last_local
+        ):
+            return
+
+        self._set_loans(new_loans)
+        self._shared_all = new_shared
+        self._local_all = new_local
+        self._shared_all_lower = [n.lower() for n in new_shared]
+        self._local_all_lower = [n.lower() for n in new_local]
+        self._apply_shared_filter()
+        self._apply_local_filter()
+        self._update_title_local_list()
+        self._last_loans = new_loans
+        self._last_shared = new_shared
+        self._last_local = new_local
+
+        missing = []
+        if not self.shared_dir.exists():
+            missing.append(f"Ordner fehlt: {self.shared_dir}")
+        if not self.local_dir.exists():
+            missing.append(f"Ordner fehlt: {self.local_dir}")
+        if missing:
+            QtWidgets.QMessageBox.warning(self, "Ordner fehlt", "\n".join(missing))
+
+    @staticmethod
+    def _refresh_mtimes(paths: tuple[Path, ...]) -> tuple:
+        def mtime(path: Path) -> int | None:
+            try:
+                return path.stat().st_mtime_ns
+            except OSError:
+                return None
+
+        return tuple((str(path), mtime(path)) for path in paths)
 
     def _update_title_local_list(self) -> None:
         lw = getattr(self, "title_local_list", None)
         if not lw:
             return
+        if self._local_all == self._last_title_local:
+            return
         lw.clear()
         lw.addItems(self._local_all)
+        self._last_title_local = list(self._local_all)
+
+    @staticmethod
+    def _pooled_project_item(lw: QtWidgets.QListWidget, row: int, layout_key: tuple) -> ProjectItem | None:
+        if row >= lw.count():
+            return None
+        widget = lw.itemWidget(lw.item(row))
+        if not isinstance(widget, ProjectItem) or widget.layout_key != layout_key or widget.is_loading:
+            return None
+        return widget
+
+    @staticmethod
+    def _place_project_item(lw: QtWidgets.QListWidget, row: int, widget: ProjectItem, *, created: bool) -> None:
+        if row < lw.count():
+            item = lw.item(row)
+            item.setHidden(False)
+        else:
+            item = QtWidgets.QListWidgetItem(lw)
+        item.setSizeHint(widget.sizeHint())
+        if created:
+            lw.setItemWidget(item, widget)
+
+    @staticmethod
+    def _hide_surplus_rows(lw: QtWidgets.QListWidget, used: int) -> None:
+        for row in range(used, lw.count()):
+            lw.item(row).setHidden(True)
 
     def _fill_shared(self, items: list[str]) -> None:
+        # Rows are reused in place; only missing or incompatible rows get a new ProjectItem.
         lw = self.shared_view.list_widget
-        lw.clear()
-        for name in items:
-            loan_info = self.loans.get(name, {}) if isinstance(self.loans, dict) else {}
-            holder = loan_info.get("holder") if isinstance(loan_info, dict) else None
-            timestamp = loan_info.get("timestamp") if isinstance(loan_info, dict) else None
+        loans_flat = self._loans_flat
+        for row, name in enumerate(items):
+            holder, timestamp = loans_flat.get(name, (None, None))
             is_borrowed = bool(holder)
             btn_text = "n.A." if is_borrowed else "Ausleihen"
             variant = "danger" if is_borrowed else "action"
             enabled = not is_borrowed
-            extra_actions = [
-                {
-                    "label": "Nur kopieren",
-                    "handler": None,
-                    "variant": "secondary",
-                    "enabled": True,
-                }
-            ]
-            widget = ProjectItem(
-                name,
-                holder,
-                timestamp,
-                btn_text,
-                None,
-                enabled=enabled,
-                variant=variant,
-                extra_actions=extra_actions,
-                main_last=True,
-            )
-            item = QtWidgets.QListWidgetItem(lw)
-            item.setSizeHint(widget.sizeHint())
-            lw.addItem(item)
-            lw.setItemWidget(item, widget)
-            if not is_borrowed:
-                widget.button.clicked.connect(lambda checked=False, n=name, w=widget: self.borrow_project(n, w))
-            if getattr(widget, "extra_buttons", None):
-                widget.extra_buttons[0].clicked.connect(lambda checked=False, n=name, w=widget: self.copy_project_only(n, w))
+            widget = self._pooled_project_item(lw, row, (("Nur kopieren",), True))
+            created = widget is None
+            if created:
+                extra_actions = [
+                    {
+                        "label": "Nur kopieren",
+                        "handler": None,
+                        "variant": "secondary",
+                        "enabled": True,
+                    }
+                ]
+                widget = ProjectItem(
+                    name,
+                    holder,
+                    timestamp,
+                    btn_text,
+                    None,
+                    enabled=enabled,
+                    variant=variant,
+                    extra_actions=extra_actions,
+                    main_last=True,
+                )
+                # Handlers read the project from the widget so they stay valid when the row is reused.
+                widget.button.clicked.connect(partial(self._borrow_click, widget))
+                widget.extra_buttons[0].clicked.connect(partial(self._copy_only_click, widget))
+            else:
+                widget.update_state(name, holder, timestamp, btn_text, enabled=enabled, variant=variant)
+            self._place_project_item(lw, row, widget, created=created)
+        self._hide_surplus_rows(lw, len(items))
 
     def _fill_local(self, items: list[str]) -> None:
         lw = self.local_view.list_widget
-        lw.clear()
-        for name in items:
-            loan_info = self.loans.get(name, {}) if isinstance(self.loans, dict) else {}
-            holder = loan_info.get("holder") if isinstance(loan_info, dict) else None
-            timestamp = loan_info.get("timestamp") if isinstance(loan_info, dict) else None
+        loans_flat = self._loans_flat
+        for row, name in enumerate(items):
+            holder, timestamp = loans_flat.get(name, (None, None))
             if name in self.local_copied:
                 copy_info = self.local_copied.get(name) or {}
                 copy_ts = copy_info.get("timestamp") if isinstance(copy_info, dict) else None
-                widget = ProjectItem(
-                    name,
-                    None,
-                    copy_ts,
-                    "Löschen",
-                    None,
-                    variant="danger",
-                    extra_actions=[
-                        {
-                            "label": "Ersetzen",
-                            "handler": None,
-                            "variant": "secondary",
-                        }
-                    ],
-                )
-                widget.holder_label.setText(f"Nur kopiert - {copy_ts}" if copy_ts else "Nur kopiert")
-                widget.button.clicked.connect(lambda checked=False, n=name: self.delete_copy_only_project(n))
-                if getattr(widget, "extra_buttons", None):
-                    widget.extra_buttons[0].clicked.connect(
-                        lambda checked=False, n=name, w=widget: self.replace_copy_only_project(n, w)
+                widget = self._pooled_project_item(lw, row, (("Ersetzen",), False))
+                created = widget is None
+                if created:
+                    widget = ProjectItem(
+                        name,
+                        None,
+                        copy_ts,
+                        "Löschen",
+                        None,
+                        variant="danger",
+                        extra_actions=[
+                            {
+                                "label": "Ersetzen",
+                                "handler": None,
+                                "variant": "secondary",
+                            }
+                        ],
                     )
+                    widget.button.clicked.connect(partial(self._delete_copy_click, widget))
+                    widget.extra_buttons[0].clicked.connect(partial(self._replace_copy_click, widget))
+                else:
+                    widget.update_state(name, None, copy_ts, "Löschen", variant="danger")
+                widget.holder_label.setText(f"Nur kopiert - {copy_ts}" if copy_ts else "Nur kopiert")
             else:
-                widget = ProjectItem(name, holder, timestamp, "Zurueckgeben", None)
-                widget.button.clicked.connect(lambda checked=False, n=name, w=widget: self.return_project(n, w))
-            item = QtWidgets.QListWidgetItem(lw)
-            item.setSizeHint(widget.sizeHint())
-            lw.addItem(item)
-            lw.setItemWidget(item, widget)
+                widget = self._pooled_project_item(lw, row, ((), False))
+                created = widget is None
+                if created:
+                    widget = ProjectItem(name, holder, timestamp, "Zurueckgeben", None)
+                    widget.button.clicked.connect(partial(self._return_click, widget))
+                else:
+                    widget.update_state(name, holder, timestamp, "Zurueckgeben")
+            self._place_project_item(lw, row, widget, created=created)
+        self._hide_surplus_rows(lw, len(items))
+
+    def _borrow_click(self, widget: ProjectItem, _checked: bool = False) -> None:
+        self.borrow_project(widget.project_name, widget)
+
+    def _copy_only_click(self, widget: ProjectItem, _checked: bool = False) -> None:
+        self.copy_project_only(widget.project_name, widget)
+
+    def _delete_copy_click(self, widget: ProjectItem, _checked: bool = False) -> None:
+        self.delete_copy_only_project(widget.project_name)
+
+    def _replace_copy_click(self, widget: ProjectItem, _checked: bool = False) -> None:
+        self.replace_copy_only_project(widget.project_name, widget)
+
+    def _return_click(self, widget: ProjectItem, _checked: bool = False) -> None:
+        self.return_project(widget.project_name, widget)
+
+    def _on_shared_search_changed(self) -> None:
+        if self.shared_view.search_edit.text().strip().lower() != self._shared_filter_term:
+            self._apply_shared_filter()
+
+    def _on_local_search_changed(self) -> None:
+        if self.local_view.search_edit.text().strip().lower() != self._local_filter_term:
+            self._apply_local_filter()
 
     def _apply_shared_filter(self) -> None:
         term = self.shared_view.search_edit.text().strip().lower()
-        items = [n for n in self._shared_all if term in n.lower()]
+        self._shared_filter_term = term
+        if term:
+            items = [n for n, n_lower in zip(self._shared_all, self._shared_all_lower) if term in n_lower]
+        else:
+            items = list(self._shared_all)
         scroll = self.shared_view.list_widget.verticalScrollBar()
         prev = scroll.value()
         self._fill_shared(items)
@@ -2561,7 +3094,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _apply_local_filter(self) -> None:
         term = self.local_view.search_edit.text().strip().lower()
-        items = [n for n in self._local_all if term in n.lower()]
+        self._local_filter_term = term
+        if term:
+            items = [n for n, n_lower in zip(self._local_all, self._local_all_lower) if term in n_lower]
+        else:
+            items = list(self._local_all)
         scroll = self.local_view.list_widget.verticalScrollBar()
         prev = scroll.value()
         self._fill_local(items)
@@ -2623,8 +3160,6 @@ class MainWindow(QtWidgets.QMainWindow):
 
         if widget:
             widget.hide_loading()
-        self._busy = False
-        self._set_buttons_enabled(True)
         if thread in self._threads:
             self._threads.remove(thread)
         if worker in self._workers:
@@ -2637,11 +3172,34 @@ class MainWindow(QtWidgets.QMainWindow):
         worker.deleteLater()
 
         if success and callable(on_success):
+            generation = self._refresh_generation
             on_success()
-        elif not success:
+            if self._refresh_generation != generation:
+                # The rows still show the pre-transfer state; keep them locked until the new listing is applied.
+                self._awaiting_lists = True
+                self._set_buttons_enabled(False)
+                return
+        self._busy = False
+        self._set_buttons_enabled(True)
+        if not success:
+            self._invalidate_shared_check()
             QtWidgets.QMessageBox.critical(self, error_title, f"{error_prefix}: {error or 'Unbekannter Fehler'}")
 
+    def _invalidate_shared_check(self) -> None:
+        self._shared_read_ok_until = 0.0
+        self._shared_rw_ok_until = 0.0
+
     def _check_shared_connection(self, *, require_write: bool = False) -> bool:
+        # Recent successful probes are trusted for a short while (5 s read, 30 s write).
+        now = time.monotonic()
+        if self._shared_check_dir != self.shared_dir:
+            self._shared_check_dir = self.shared_dir
+            self._invalidate_shared_check()
+        ok_until = self._shared_rw_ok_until
+        if not require_write:
+            ok_until = max(ok_until, self._shared_read_ok_until)
+        if now < ok_until and self.shared_dir.exists():
+            return True
         if not self.shared_dir or not self.shared_dir.exists() or not self.shared_dir.is_dir():
             QtWidgets.QMessageBox.critical(
                 self,
@@ -2674,6 +3232,8 @@ class MainWindow(QtWidgets.QMainWindow):
                     f"Der Shared-Ordner kann nicht beschrieben werden:\n{exc}",
                 )
                 return False
+            self._shared_rw_ok_until = now + 30.0
+        self._shared_read_ok_until = now + 5.0
         return True
 
     def borrow_project(self, name: str, widget: ProjectItem | None = None) -> None:
@@ -2812,7 +3372,7 @@ class MainWindow(QtWidgets.QMainWindow):
         box.setIcon(QtWidgets.QMessageBox.Warning)
         box.setStandardButtons(QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
         box.setDefaultButton(QtWidgets.QMessageBox.No)
-        box.setStyleSheet(self._build_stylesheet(self._current_colors()))
+        box.setStyleSheet(self._get_current_stylesheet())
         box.setWindowModality(QtCore.Qt.WindowModal)
         if box.exec() != QtWidgets.QMessageBox.Yes:
             return
@@ -2840,7 +3400,7 @@ class MainWindow(QtWidgets.QMainWindow):
         box.setIcon(QtWidgets.QMessageBox.Warning)
         box.setStandardButtons(QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
         box.setDefaultButton(QtWidgets.QMessageBox.No)
-        box.setStyleSheet(self._build_stylesheet(self._current_colors()))
+        box.setStyleSheet(self._get_current_stylesheet())
         box.setWindowModality(QtCore.Qt.WindowModal)
         if box.exec() != QtWidgets.QMessageBox.Yes:
             return
@@ -2876,41 +3436,50 @@ class MainWindow(QtWidgets.QMainWindow):
         target = backup_root / name / timestamp
         try:
             target.parent.mkdir(parents=True, exist_ok=True)
-            existing = sorted([p for p in target.parent.iterdir() if p.is_dir()])
-            if len(existing) >= 5:
-                oldest = existing[0]
-                shutil.rmtree(oldest, onerror=_handle_remove_readonly)
+            # The index keeps pruning to a small JSON read instead of listing the backup folder.
+            entries = [e for e in _read_backup_index(target.parent) if e[0] != timestamp]
+            while len(entries) >= _BACKUP_KEEP:
+                oldest = target.parent / entries.pop(0)[0]
+                if oldest.exists():
+                    shutil.rmtree(oldest, onerror=_handle_remove_readonly)
+            # Record the backup before copying so a failed copy can never leave an unindexed folder behind.
+            entry = [timestamp, None]
+            entries.append(entry)
+            target.mkdir(exist_ok=True)
+            _write_backup_index(target.parent, entries)
             emit = progress_emit or (lambda d, t, stage="": None)
-            self._copy_directory_with_progress(src, target, emit, "Backup")
+            try:
+                entry[1] = self._copy_directory_with_progress(src, target, emit, "Backup")
+            except Exception:
+                shutil.rmtree(target, ignore_errors=True)
+                if not target.exists():
+                    entries.remove(entry)
+                _write_backup_index(target.parent, entries)
+                raise
+            _write_backup_index(target.parent, entries)
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError(f"Backup fehlgeschlagen: {target} ({exc})") from exc
 
-    def _copy_directory_with_progress(self, src: Path, dst: Path, progress_emit, stage_prefix: str | None = None) -> None:
-        total_bytes = 0
-        for root, _, files in os.walk(src):
-            for fname in files:
-                try:
-                    total_bytes += (Path(root) / fname).stat().st_size
-                except OSError:
-                    continue
+    def _copy_directory_with_progress(self, src: Path, dst: Path, progress_emit, stage_prefix: str | None = None) -> int:
+        dirs, files, total_bytes = _scan_copy_tree(src, dst)
         done_bytes = 0
         progress_emit(done_bytes, total_bytes, stage_prefix or "")
-        for root, dirs, files in os.walk(src):
-            rel_root = Path(root).relative_to(src)
-            target_root = dst / rel_root
-            target_root.mkdir(parents=True, exist_ok=True)
-            for d in dirs:
-                (target_root / d).mkdir(parents=True, exist_ok=True)
-            for fname in files:
-                s = Path(root) / fname
-                d = target_root / fname
-                shutil.copy2(s, d)
-                try:
-                    done_bytes += s.stat().st_size
-                except OSError:
-                    pass
+        dst.mkdir(parents=True, exist_ok=True)
+        for target_dir in dirs:
+            target_dir.mkdir(parents=True, exist_ok=True)
+        # Report at most every 100 ms or 0.5 % of the data (min. 1 MiB) instead of per file.
+        byte_step = max(total_bytes // 200, 1 << 20)
+        last_emit = time.monotonic()
+        last_emit_bytes = 0
+        for size in _copy_files(files, total_bytes):
+            done_bytes += size
+            now = time.monotonic()
+            if now - last_emit >= 0.1 or done_bytes - last_emit_bytes >= byte_step:
                 progress_emit(done_bytes, total_bytes, stage_prefix or "")
+                last_emit = now
+                last_emit_bytes = done_bytes
         progress_emit(total_bytes, total_bytes, stage_prefix or "")
+        return total_bytes
 
     def _set_buttons_enabled(self, enabled: bool) -> None:
         for lw in (self.shared_view.list_widget, self.local_view.list_widget):
@@ -2924,11 +3493,47 @@ class MainWindow(QtWidgets.QMainWindow):
                     btn.setEnabled(allow)
 
 
+@dataclass(slots=True)
+class BlockDef:
+    id: str | None = None
+    title: str | None = None
+    type: str | None = None
+    block_type: str | None = None
+    inputs: int | list[str] | None = None
+    outputs: int | list[str] | None = None
+    allow_inputs: bool = True
+    allow_outputs: bool = True
+    pos: list | tuple | None = None
+    input_labels: list[str] | None = None
+    output_labels: list[str] | None = None
+
+    @classmethod
+    def from_dict(cls, cfg: dict) -> BlockDef:
+        return cls(
+            id=cfg.get("id") or cfg.get("block_id"),
+            title=cfg.get("title"),
+            type=cfg.get("type"),
+            block_type=cfg.get("block_type"),
+            inputs=cfg.get("inputs"),
+            outputs=cfg.get("outputs"),
+            allow_inputs=cfg.get("allow_inputs", True),
+            allow_outputs=cfg.get("allow_outputs", True),
+            pos=cfg.get("pos"),
+            input_labels=cfg.get("input_labels"),
+            output_labels=cfg.get("output_labels"),
+        )
+
+
 class NodeEditorWidget(QtWidgets.QWidget):
     dirty_changed = QtCore.Signal(bool)
     component_loaded = QtCore.Signal(str)
     def __init__(
-        self, accent_color: str = "#3f8efc", accent_color_secondary: str = "#13a8cd", parent: QtWidgets.QWidget | None = None
+        self,
+        accent_color: str = "#3f8efc",
+        accent_color_secondary: str = "#13a8cd",
+        parent: QtWidgets.QWidget | None = None,
+        *,
+        use_opengl: bool = False,
     ) -> None:
         super().__init__(parent)
         self.accent_color = accent_color or "#3f8efc"
@@ -2936,10 +3541,17 @@ class NodeEditorWidget(QtWidgets.QWidget):
         self.grid_size = 20
         self.scene = QtWidgets.QGraphicsScene(self)
         self.scene.setSceneRect(0, 0, 1600, 900)
+        # Only a few dozen items, most of them movable: a BSP index costs more on drags than it saves on lookups.
+        self.scene.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
         self.view = NodeGraphicsView(self.scene, self)
         self.view.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.TextAntialiasing)
         self.view.setDragMode(QtWidgets.QGraphicsView.RubberBandDrag)
-        self.view.setViewportUpdateMode(QtWidgets.QGraphicsView.FullViewportUpdate)
+        self.view.setViewportUpdateMode(QtWidgets.QGraphicsView.SmartViewportUpdate)
+        self.view.setOptimizationFlag(QtWidgets.QGraphicsView.DontSavePainterState, True)
+        # Stock shape items include the pen width in their bounding rects; StaticLabelItem pads its own.
+        self.view.setOptimizationFlag(QtWidgets.QGraphicsView.DontAdjustForAntialiasing, True)
+        if use_opengl:
+            self.view.enable_opengl_viewport()
         self.view.setAcceptDrops(True)
         self.setAcceptDrops(True)
 
@@ -2949,6 +3561,17 @@ class NodeEditorWidget(QtWidgets.QWidget):
         layout.addWidget(self.view)
 
         self._blocks: list[NodeBlock] = []
+        # Fixed per-block fields kept parallel to _blocks so serialization zips lists instead of walking items.
+        self._block_ids: list[str] = []
+        self._block_titles: list[str] = []
+        self._block_types: list[str | None] = []
+        self._block_allow: list[tuple[bool, bool]] = []
+        # Insertion-ordered so saved files list connections in creation order.
+        self._connections: dict[ConnectionItem, None] = {}
+        self._pending_connection_updates: set[ConnectionItem] = set()
+        self._pen_cache: dict[tuple[str, str], QtGui.QPen] = {}
+        self._brush_cache: dict[tuple[str, str], QtGui.QBrush] = {}
+        self._connection_flush_scheduled = False
         self._pending_connector: ConnectorItem | None = None
         self.current_component_path: Path | None = None
         self.current_component_name: str = ""
@@ -2968,11 +3591,9 @@ class NodeEditorWidget(QtWidgets.QWidget):
             self.accent_color = accent
         if accent2:
             self.accent_color_secondary = accent2
-        for item in self.scene.items():
-            if isinstance(item, ConnectionItem):
-                pen = item.pen()
-                pen.setColor(QtGui.QColor(accent))
-                item.setPen(pen)
+        pen = self.cached_pen(accent, "connection")
+        for item in self._connections:
+            item.setPen(pen)
         for block in self._blocks:
             for connector in block.connectors:
                 connector.refresh_brush(self.accent_color, self.accent_color_secondary)
@@ -2991,33 +3612,42 @@ class NodeEditorWidget(QtWidgets.QWidget):
         self._line_preview = None
 
     def clear_scene(self) -> None:
+        # Only top-level items: removing a parent detaches its children, and NoIndex lists parents first.
         for item in list(self.scene.items()):
-            self.scene.removeItem(item)
+            if item.parentItem() is None:
+                self.scene.removeItem(item)
         self._blocks.clear()
+        self._block_ids.clear()
+        self._block_titles.clear()
+        self._block_types.clear()
+        self._block_allow.clear()
+        self._connections.clear()
         self._pending_connector = None
         self._block_id_counter = 0
         self._dirty = False
         self._emit_dirty()
 
-    def add_block(self, title: str | None = None, block_config: dict | None = None, *, mark_dirty: bool = True) -> "NodeBlock":
+    def add_block(
+        self, title: str | None = None, block_config: dict | BlockDef | None = None, *, mark_dirty: bool = True
+    ) -> "NodeBlock":
         idx = len(self._blocks) + 1
-        cfg = block_config or {}
-        block_id = str(cfg.get("id") or cfg.get("block_id") or f"b{self._block_id_counter + 1}")
+        spec = block_config if isinstance(block_config, BlockDef) else BlockDef.from_dict(block_config or {})
+        block_id = str(spec.id or f"b{self._block_id_counter + 1}")
         self._block_id_counter += 1
         block = NodeBlock(
-            title or cfg.get("title") or f"Block {idx}",
+            title or spec.title or f"Block {idx}",
             self,
-            inputs=cfg.get("inputs"),
-            outputs=cfg.get("outputs"),
-            allow_inputs=cfg.get("allow_inputs", True),
-            allow_outputs=cfg.get("allow_outputs", True),
-            input_labels=cfg.get("input_labels"),
-            output_labels=cfg.get("output_labels"),
-            block_type=cfg.get("block_type") or cfg.get("type"),
+            inputs=spec.inputs,
+            outputs=spec.outputs,
+            allow_inputs=spec.allow_inputs,
+            allow_outputs=spec.allow_outputs,
+            input_labels=spec.input_labels,
+            output_labels=spec.output_labels,
+            block_type=spec.block_type or spec.type,
             block_id=block_id,
         )
         self.scene.addItem(block)
-        pos = cfg.get("pos")
+        pos = spec.pos
         if isinstance(pos, (list, tuple)) and len(pos) == 2:
             try:
                 block.setPos(float(pos[0]), float(pos[1]))
@@ -3026,11 +3656,26 @@ class NodeEditorWidget(QtWidgets.QWidget):
         else:
             block.setPos(80 + idx * 50, 80 + idx * 30)
         self._blocks.append(block)
+        self._block_ids.append(block.block_id)
+        self._block_titles.append(block.title_item.text())
+        self._block_types.append(block.block_type)
+        self._block_allow.append((block.allow_inputs, block.allow_outputs))
         block.setSelected(True)
         if mark_dirty:
             self.mark_dirty()
         return block
 
+    def _remove_block(self, block: "NodeBlock") -> None:
+        try:
+            idx = self._blocks.index(block)
+        except ValueError:
+            return
+        del self._blocks[idx]
+        del self._block_ids[idx]
+        del self._block_titles[idx]
+        del self._block_types[idx]
+        del self._block_allow[idx]
+
     def _selected_block(self) -> "NodeBlock | None":
         for item in self.scene.selectedItems():
             if isinstance(item, NodeBlock):
@@ -3049,14 +3694,57 @@ class NodeEditorWidget(QtWidgets.QWidget):
             return False
 
     def create_connection(self, start: "ConnectorItem", end: "ConnectorItem") -> None:
-        connection = ConnectionItem(start, end, self.accent_color)
+        connection = ConnectionItem(start, end, self.accent_color, self)
         self.scene.addItem(connection)
+        self._connections[connection] = None
         start.add_connection(connection)
         end.add_connection(connection)
         connection.update_path()
         self.mark_dirty()
         self._cancel_line()
 
+    def cached_pen(self, color: str, kind: str) -> QtGui.QPen:
+        # Connectors and connections share a handful of pens; build each once instead of per repaint/toggle.
+        key = (color, kind)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            qcolor = QtGui.QColor(color)
+            if kind == "connection":
+                pen = QtGui.QPen(qcolor, 2)
+                pen.setCapStyle(QtCore.Qt.RoundCap)
+                pen.setJoinStyle(QtCore.Qt.RoundJoin)
+            elif kind == "highlight":
+                pen = QtGui.QPen(qcolor, 2.4)
+            elif kind == "output":
+                pen = QtGui.QPen(qcolor, 1.6)
+            else:
+                pen = QtGui.QPen(QtGui.QColor("#555555").darker(120), 1.6)
+            self._pen_cache[key] = pen
+        return pen
+
+    def cached_brush(self, color: str, kind: str) -> QtGui.QBrush:
+        key = (color, kind)
+        brush = self._brush_cache.get(key)
+        if brush is None:
+            brush = QtGui.QBrush(QtGui.QColor(color if kind == "output" else "#555555"))
+            self._brush_cache[key] = brush
+        return brush
+
+    def queue_connection_updates(self, connections) -> None:
+        # Coalesce path rebuilds from many position events into one pass per event-loop turn.
+        self._pending_connection_updates.update(connections)
+        if not self._connection_flush_scheduled and self._pending_connection_updates:
+            self._connection_flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self._flush_connection_updates)
+
+    def _flush_connection_updates(self) -> None:
+        self._connection_flush_scheduled = False
+        pending = self._pending_connection_updates
+        self._pending_connection_updates = set()
+        for connection in pending:
+            if connection.scene() is not None:
+                connection.update_path()
+
     def mark_dirty(self, dirty: bool = True) -> None:
         if self._suspend_dirty:
             return
@@ -3065,11 +3753,21 @@ class NodeEditorWidget(QtWidgets.QWidget):
         self._dirty = dirty
         self._emit_dirty()
 
+    @property
+    def grid_size(self) -> int:
+        return self._grid_size
+
+    @grid_size.setter
+    def grid_size(self, value: int) -> None:
+        self._grid_size = value
+        self._grid = int(value or 20)
+        self._half_grid = self._grid >> 1
+
     def snap_point(self, point: QtCore.QPointF) -> QtCore.QPointF:
-        g = float(self.grid_size or 20)
-        x = round(point.x() / g) * g
-        y = round(point.y() / g) * g
-        return QtCore.QPointF(x, y)
+        # Hot path during drags: whole-pixel integer snap, no float division or round().
+        g = self._grid
+        h = self._half_grid
+        return QtCore.QPointF((math.floor(point.x()) + h) // g * g, (math.floor(point.y()) + h) // g * g)
 
     def _emit_dirty(self) -> None:
         self.dirty_changed.emit(bool(self._dirty))
@@ -3083,6 +3781,9 @@ class NodeEditorWidget(QtWidgets.QWidget):
     def is_line_mode_active(self) -> bool:
         return bool(self._line_button and self._line_button.isChecked())
 
+    def is_line_drawing(self) -> bool:
+        return self.is_line_mode_active() and self._line_active and bool(self._line_points)
+
     def _cancel_line(self) -> None:
         self._line_active = False
         self._line_points = []
@@ -3154,10 +3855,8 @@ class NodeEditorWidget(QtWidgets.QWidget):
             self._line_points = [origin]
         target = self._aligned_point(origin, snapped, self._line_direction)
         self._line_preview = target
-        pts = list(self._line_points)
-        pts.append(target)
         if self._line_item:
-            self._line_item.update_points(pts)
+            self._line_item.update_points(self._line_points, target)
         return True
 
     def handle_line_mouse_double(self, event: QtGui.QMouseEvent, scene_pos: QtCore.QPointF) -> bool:
@@ -3180,91 +3879,110 @@ class NodeEditorWidget(QtWidgets.QWidget):
         return True
 
     def _find_connector(self, scene_pos: QtCore.QPointF) -> ConnectorItem | None:
-        for itm in self.scene.items(scene_pos):
-            if isinstance(itm, ConnectorItem):
-                return itm
+        # Connectors only live on block edges: test the few blocks near the point instead of every scene item.
+        pad = 16.0
+        for block in reversed(self._blocks):
+            if not block.sceneBoundingRect().adjusted(-pad, -pad, pad, pad).contains(scene_pos):
+                continue
+            for conn in block.connectors:
+                if conn.contains(conn.mapFromScene(scene_pos)):
+                    return conn
         return None
 
     def load_component(self, path: Path) -> bool:
-        self._suspend_dirty = True
         try:
-            with Path(path).open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json_file(path)
         except Exception:
             data = {}
         if data.get("kind") == "basic" or data.get("basic") is True or ("basic" in [p.lower() for p in path.parts]):
-            self._suspend_dirty = False
             return False
-        self._cancel_line()
-        nodes = data.get("nodes")
-        if not isinstance(nodes, list):
-            nodes = []
-        self.clear_scene()
-        id_to_block: dict[str, NodeBlock] = {}
-        for idx, node in enumerate(nodes):
-            if not isinstance(node, dict):
-                continue
-            node_id = str(node.get("id", idx))
-            ntype = (node.get("type") or "").lower()
-            allow_inputs = node.get("allow_inputs", True)
-            allow_outputs = node.get("allow_outputs", True)
-            inputs_cfg = node.get("inputs")
-            outputs_cfg = node.get("outputs")
-            if ntype == "eingang":
-                allow_inputs = False
-                if outputs_cfg is None:
-                    outputs_cfg = 1
-            if ntype == "ausgang":
-                allow_outputs = False
-                if inputs_cfg is None:
-                    inputs_cfg = 1
-            block = self.add_block(
-                node.get("title") or node.get("name"),
-                {
-                    "inputs": inputs_cfg,
-                    "outputs": outputs_cfg,
-                    "allow_inputs": allow_inputs,
-                    "allow_outputs": allow_outputs,
-                    "pos": node.get("pos"),
-                    "input_labels": node.get("input_labels"),
-                    "output_labels": node.get("output_labels"),
-                    "type": node.get("type"),
-                    "id": node.get("id"),
-                },
-            )
-            id_to_block[node_id] = block
-
-        connections = data.get("connections", [])
-        if isinstance(connections, list):
-            for conn in connections:
-                if not isinstance(conn, dict):
-                    continue
-                src = conn.get("from") or conn.get("source")
-                dst = conn.get("to") or conn.get("target")
-                if not isinstance(src, dict) or not isinstance(dst, dict):
-                    continue
-                src_block = id_to_block.get(str(src.get("node")))
-                dst_block = id_to_block.get(str(dst.get("node")))
-                if not src_block or not dst_block:
-                    continue
-                try:
-                    out_idx = int(src.get("output", 0))
-                    in_idx = int(dst.get("input", 0))
-                except (TypeError, ValueError):
-                    continue
-                if out_idx < 0 or in_idx < 0:
-                    continue
-                if out_idx >= len(src_block.outputs) or in_idx >= len(dst_block.inputs):
+        with self._bulk_mutate(mark_dirty=False):
+            self._cancel_line()
+            nodes = data.get("nodes")
+            if not isinstance(nodes, list):
+                nodes = []
+            self.clear_scene()
+            id_to_block: dict[str, NodeBlock] = {}
+            for idx, node in enumerate(nodes):
+                if not isinstance(node, dict):
                     continue
-                self.create_connection(src_block.outputs[out_idx], dst_block.inputs[in_idx])
-        self.current_component_path = path
-        self.current_component_name = path.stem
-        self.component_loaded.emit(self.current_component_name)
-        self._dirty = False
-        self._emit_dirty()
-        self._suspend_dirty = False
+                node_id = str(node.get("id", idx))
+                ntype = (node.get("type") or "").lower()
+                allow_inputs = node.get("allow_inputs", True)
+                allow_outputs = node.get("allow_outputs", True)
+                inputs_cfg = node.get("inputs")
+                outputs_cfg = node.get("outputs")
+                if ntype == "eingang":
+                    allow_inputs = False
+                    if outputs_cfg is None:
+                        outputs_cfg = 1
+                if ntype == "ausgang":
+                    allow_outputs = False
+                    if inputs_cfg is None:
+                        inputs_cfg = 1
+                block = self.add_block(
+                    node.get("title") or node.get("name"),
+                    BlockDef(
+                        id=node.get("id"),
+                        type=node.get("type"),
+                        inputs=inputs_cfg,
+                        outputs=outputs_cfg,
+                        allow_inputs=allow_inputs,
+                        allow_outputs=allow_outputs,
+                        pos=node.get("pos"),
+                        input_labels=node.get("input_labels"),
+                        output_labels=node.get("output_labels"),
+                    ),
+                )
+                id_to_block[node_id] = block
+
+            connections = data.get("connections", [])
+            if isinstance(connections, list):
+                for conn in connections:
+                    if not isinstance(conn, dict):
+                        continue
+                    src = conn.get("from") or conn.get("source")
+                    dst = conn.get("to") or conn.get("target")
+                    if not isinstance(src, dict) or not isinstance(dst, dict):
+                        continue
+                    src_block = id_to_block.get(str(src.get("node")))
+                    dst_block = id_to_block.get(str(dst.get("node")))
+                    if not src_block or not dst_block:
+                        continue
+                    try:
+                        out_idx = int(src.get("output", 0))
+                        in_idx = int(dst.get("input", 0))
+                    except (TypeError, ValueError):
+                        continue
+                    if out_idx < 0 or in_idx < 0:
+                        continue
+                    if out_idx >= len(src_block.outputs) or in_idx >= len(dst_block.inputs):
+                        continue
+                    self.create_connection(src_block.outputs[out_idx], dst_block.inputs[in_idx])
+            self.current_component_path = path
+            self.current_component_name = path.stem
+            self.component_loaded.emit(self.current_component_name)
+            self._dirty = False
+            self._emit_dirty()
         return True
 
+    @contextmanager
+    def _bulk_mutate(self, *, mark_dirty: bool = True):
+        # One repaint and at most one dirty notification for a whole batch of scene edits.
+        was_suspended = self._suspend_dirty
+        signals_blocked = self.scene.blockSignals(True)
+        self._suspend_dirty = True
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.scene.blockSignals(signals_blocked)
+            self._suspend_dirty = was_suspended
+            if mark_dirty:
+                self.mark_dirty()
+            self.scene.update()
+
     def add_basic_block(self, data: dict, fallback_name: str) -> NodeBlock | None:
         allow_inputs = data.get("allow_inputs", True)
         allow_outputs = data.get("allow_outputs", True)
@@ -3279,40 +3997,54 @@ class NodeEditorWidget(QtWidgets.QWidget):
             allow_outputs = False
             if inputs_cfg is None:
                 inputs_cfg = 1
-        block = self.add_block(
-            data.get("title") or data.get("name") or fallback_name,
-            {
-                "inputs": inputs_cfg,
-                "outputs": outputs_cfg,
-                "allow_inputs": allow_inputs,
-                "allow_outputs": allow_outputs,
-                "input_labels": data.get("input_labels"),
-                "output_labels": data.get("output_labels"),
-                "type": data.get("type"),
-                "block_type": "basic",
-            },
-            mark_dirty=True,
-        )
+        with self._bulk_mutate():
+            block = self.add_block(
+                data.get("title") or data.get("name") or fallback_name,
+                BlockDef(
+                    type=data.get("type"),
+                    block_type="basic",
+                    inputs=inputs_cfg,
+                    outputs=outputs_cfg,
+                    allow_inputs=allow_inputs,
+                    allow_outputs=allow_outputs,
+                    input_labels=data.get("input_labels"),
+                    output_labels=data.get("output_labels"),
+                ),
+                mark_dirty=False,
+            )
         return block
 
     def serialize_component(self) -> dict:
         nodes = []
-        for block in self._blocks:
-            nodes.append(block.to_dict())
+        for block, block_id, title, block_type, (allow_inputs, allow_outputs) in zip(
+            self._blocks, self._block_ids, self._block_titles, self._block_types, self._block_allow
+        ):
+            pos = block.pos()
+            nodes.append(
+                {
+                    "id": block_id,
+                    "title": title,
+                    "type": block_type,
+                    "allow_inputs": allow_inputs,
+                    "allow_outputs": allow_outputs,
+                    "inputs": len(block.inputs),
+                    "outputs": len(block.outputs),
+                    "input_labels": [conn.label_item.text() for conn in block.inputs],
+                    "output_labels": [conn.label_item.text() for conn in block.outputs],
+                    "pos": [pos.x(), pos.y()],
+                }
+            )
         connections = []
-        for item in self.scene.items():
-            if not isinstance(item, ConnectionItem):
-                continue
+        for item in self._connections:
             start = item.start_connector
             end = item.end_connector
             s_block = start.parentItem()
             e_block = end.parentItem()
             if not isinstance(s_block, NodeBlock) or not isinstance(e_block, NodeBlock):
                 continue
-            try:
-                s_out_idx = s_block.outputs.index(start)
-                e_in_idx = e_block.inputs.index(end)
-            except ValueError:
+            s_out_idx = s_block.connector_index(start, s_block.outputs)
+            e_in_idx = e_block.connector_index(end, e_block.inputs)
+            if s_out_idx is None or e_in_idx is None:
                 continue
             connections.append(
                 {
@@ -3329,7 +4061,7 @@ class NodeEditorWidget(QtWidgets.QWidget):
         try:
             self.current_component_path.parent.mkdir(parents=True, exist_ok=True)
             with self.current_component_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(_dump_json_pretty(data))
             self._dirty = False
             self._emit_dirty()
             return True, None
@@ -3353,22 +4085,18 @@ class NodeEditorWidget(QtWidgets.QWidget):
                 kind = bytes(mime.data("application/x-library-kind")).decode("utf-8")
             except Exception:
                 kind = None
+        if not self.current_component_path:
+            # kein Component-Kontext offen -> abbrechen
+            return
+        hinted_basic = bool(kind and "basic" in kind) or "basic" in [p.lower() for p in path.parts]
+        if not hinted_basic and not _probe_basic(path):
+            # drag/drop nur für Basic-Blocks erlaubt
+            return
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json_file(path)
         except Exception:
             data = {}
-        is_basic = (
-            data.get("kind") == "basic"
-            or data.get("basic") is True
-            or (kind and "basic" in kind)
-            or ("basic" in [p.lower() for p in path.parts])
-        )
-        if not is_basic:
-            # drag/drop nur für Basic-Blocks erlaubt
-            return
-        if not self.current_component_path:
-            # kein Component-Kontext offen -> abbrechen
+        if not (hinted_basic or data.get("kind") == "basic" or data.get("basic") is True):
             return
         block = self.add_basic_block(data, path.stem)
         if block:
@@ -3407,7 +4135,54 @@ class NodeEditorWidget(QtWidgets.QWidget):
         self._pending_connector = None
 
 
+class StaticLabelItem(QtWidgets.QGraphicsItem):
+    """Plain-text label that lays its text out once via QStaticText instead of on every paint."""
+
+    def __init__(self, text: str, color: str, parent: QtWidgets.QGraphicsItem | None = None) -> None:
+        super().__init__(parent)
+        self._color = QtGui.QColor(color)
+        self._font = QtGui.QFont()
+        self._static = QtGui.QStaticText()
+        self._static.setTextFormat(QtCore.Qt.PlainText)
+        self._rect = QtCore.QRectF()
+        self.setText(text)
+
+    def text(self) -> str:
+        return self._static.text()
+
+    def setText(self, text: str) -> None:
+        self.prepareGeometryChange()
+        self._static.setText(text)
+        self._static.prepare(QtGui.QTransform(), self._font)
+        # Pad for antialiased glyph overhang; the view skips its own antialiasing adjustment.
+        self._rect = QtCore.QRectF(QtCore.QPointF(0, 0), self._static.size()).adjusted(-1, -1, 1, 1)
+
+    def text_size(self) -> QtCore.QSizeF:
+        return self._static.size()
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return self._rect
+
+    def paint(self, painter: QtGui.QPainter, option, widget=None) -> None:
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        painter.drawStaticText(0, 0, self._static)
+
+
 class NodeBlock(QtWidgets.QGraphicsRectItem):
+    __slots__ = (
+        "editor",
+        "allow_inputs",
+        "allow_outputs",
+        "block_type",
+        "block_id",
+        "_bulk",
+        "title_item",
+        "inputs",
+        "outputs",
+        "connectors",
+    )
+
     def __init__(
         self,
         title: str,
@@ -3427,6 +4202,7 @@ class NodeBlock(QtWidgets.QGraphicsRectItem):
         self.allow_outputs = allow_outputs
         self.block_type = block_type
         self.block_id = block_id or title
+        self._bulk = False
         self.setAcceptDrops(True)
         self.setBrush(QtGui.QColor("#1f1f1f"))
         self.setPen(QtGui.QPen(QtGui.QColor("#3c3c3c"), 1.2))
@@ -3434,9 +4210,10 @@ class NodeBlock(QtWidgets.QGraphicsRectItem):
         self.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable, True)
         self.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setAcceptHoverEvents(True)
+        # Pure translation keeps a device-coordinate cache valid, so dragging and panning just blit it.
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
 
-        self.title_item = QtWidgets.QGraphicsSimpleTextItem(title, self)
-        self.title_item.setBrush(QtGui.QBrush(QtGui.QColor("#e6e6e6")))
+        self.title_item = StaticLabelItem(title, "#e6e6e6", self)
         self.title_item.setPos(12, 10)
 
         self.inputs: list[ConnectorItem] = []
@@ -3463,14 +4240,20 @@ class NodeBlock(QtWidgets.QGraphicsRectItem):
                 else:
                     self.add_output(label or f"Output {idx + 1}")
 
+        # Lay out once after all connectors exist instead of after every add_input/add_output.
+        self._bulk = True
         init_side(self.inputs, inputs, input_labels, True)
         init_side(self.outputs, outputs, output_labels, False)
         if not self.inputs and self.allow_inputs:
             self.add_input("Input 1")
         if not self.outputs and self.allow_outputs:
             self.add_output("Output 1")
+        self._bulk = False
+        self._layout_connectors()
 
     def _layout_connectors(self) -> None:
+        if self._bulk:
+            return
         top_offset = 32
         spacing = 24
         count = max(len(self.inputs), len(self.outputs), 1)
@@ -3479,15 +4262,16 @@ class NodeBlock(QtWidgets.QGraphicsRectItem):
         if rect.height() != new_height:
             self.setRect(0, 0, rect.width(), new_height)
         for idx, conn in enumerate(self.inputs):
+            conn._index_hint = idx
             y = top_offset + idx * spacing - conn.radius()
             conn.setPos(-conn.radius(), y)
         for idx, conn in enumerate(self.outputs):
+            conn._index_hint = idx
             y = top_offset + idx * spacing - conn.radius()
             conn.setPos(self.rect().width() - conn.radius(), y)
             conn.align_label_left()
         for conn in self.connectors:
             conn.update_connections()
-        self.editor.mark_dirty()
 
     def add_input(self, label: str | None = None) -> ConnectorItem | None:
         if not self.allow_inputs:
@@ -3499,7 +4283,8 @@ class NodeBlock(QtWidgets.QGraphicsRectItem):
         self.inputs.append(input_conn)
         self.connectors.append(input_conn)
         self._layout_connectors()
-        self.editor.mark_dirty()
+        if not self._bulk:
+            self.editor.mark_dirty()
         return input_conn
 
     def add_output(self, label: str | None = None) -> ConnectorItem | None:
@@ -3512,7 +4297,8 @@ class NodeBlock(QtWidgets.QGraphicsRectItem):
         self.outputs.append(output_conn)
         self.connectors.append(output_conn)
         self._layout_connectors()
-        self.editor.mark_dirty()
+        if not self._bulk:
+            self.editor.mark_dirty()
         return output_conn
 
     def remove_connector(self, connector: "ConnectorItem") -> None:
@@ -3531,6 +4317,7 @@ class NodeBlock(QtWidgets.QGraphicsRectItem):
                 other = connection.start_connector
             if other and connection in other.connections:
                 other.connections.remove(connection)
+            self.editor._connections.pop(connection, None)
             if connection.scene():
                 connection.scene().removeItem(connection)
         if connector.scene():
@@ -3538,6 +4325,16 @@ class NodeBlock(QtWidgets.QGraphicsRectItem):
         self._layout_connectors()
         self.editor.mark_dirty()
 
+    @staticmethod
+    def connector_index(connector: "ConnectorItem", side: list["ConnectorItem"]) -> int | None:
+        idx = connector._index_hint
+        if idx is not None and idx < len(side) and side[idx] is connector:
+            return idx
+        try:
+            return side.index(connector)
+        except ValueError:
+            return None
+
     def is_basic(self) -> bool:
         t = str(self.block_type or "").lower()
         return t in ("basic", "eingang", "ausgang")
@@ -3558,17 +4355,18 @@ class NodeBlock(QtWidgets.QGraphicsRectItem):
             self.remove_connector(conn)
         if self.scene():
             self.scene().removeItem(self)
-        if self in self.editor._blocks:
-            self.editor._blocks.remove(self)
+        self.editor._remove_block(self)
         self.editor.mark_dirty()
 
     def itemChange(self, change: QtWidgets.QGraphicsItem.GraphicsItemChange, value):
         if change == QtWidgets.QGraphicsItem.ItemPositionChange:
             return self.editor.snap_point(value)
         if change == QtWidgets.QGraphicsItem.ItemPositionHasChanged:
+            editor = self.editor
             for connector in self.connectors:
-                connector.update_connections()
-            self.editor.mark_dirty()
+                if connector.connections:
+                    editor.queue_connection_updates(connector.connections)
+            editor.mark_dirty()
         return super().itemChange(change, value)
 
     def dragEnterEvent(self, event: QtWidgets.QGraphicsSceneDragDropEvent) -> None:
@@ -3600,53 +4398,39 @@ class NodeBlock(QtWidgets.QGraphicsRectItem):
                 return
         super().dropEvent(event)
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.block_id,
-            "title": self.title_item.text(),
-            "type": self.block_type,
-            "allow_inputs": self.allow_inputs,
-            "allow_outputs": self.allow_outputs,
-            "inputs": len(self.inputs),
-            "outputs": len(self.outputs),
-            "input_labels": [conn.label_item.text() for conn in self.inputs],
-            "output_labels": [conn.label_item.text() for conn in self.outputs],
-            "pos": [self.pos().x(), self.pos().y()],
-        }
-
 
 class ConnectorItem(QtWidgets.QGraphicsEllipseItem):
+    __slots__ = ("kind", "editor", "connections", "_index_hint", "label_item", "delete_btn")
+
     def __init__(self, kind: str, label: str, editor: NodeEditorWidget) -> None:
         super().__init__(0, 0, 14, 14)
         self.kind = kind
         self.editor = editor
         self.connections: list[ConnectionItem] = []
+        self._index_hint: int | None = None
 
-        self.label_item = QtWidgets.QGraphicsSimpleTextItem(label, self)
-        self.label_item.setBrush(QtGui.QBrush(QtGui.QColor("#dcdcdc")))
+        self.label_item = StaticLabelItem(label, "#dcdcdc", self)
         self.label_item.setPos(18, -2)
 
         self.delete_btn = RemoveButtonItem(self, self._request_delete)
         self.refresh_brush(editor.accent_color, editor.accent_color_secondary)
         self.setAcceptHoverEvents(True)
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
         self.update_delete_btn_position()
 
     def radius(self) -> float:
         return self.boundingRect().width() / 2
 
     def refresh_brush(self, accent: str, accent2: str | None = None) -> None:
-        accent_color = QtGui.QColor(accent or "#3f8efc")
-        base = QtGui.QColor("#555555")
-        brush_color = accent_color if self.kind == "output" else base
-        self.setBrush(QtGui.QBrush(brush_color))
-        self.setPen(QtGui.QPen(accent_color if self.kind == "output" else base.darker(120), 1.6))
+        accent = accent or "#3f8efc"
+        self.setBrush(self.editor.cached_brush(accent, self.kind))
+        self.setPen(self.editor.cached_pen(accent, self.kind))
         if self.delete_btn:
             self.delete_btn.set_accent(accent2 or "#13a8cd")
 
     def setHighlighted(self, enabled: bool) -> None:
         if enabled:
-            pen = QtGui.QPen(QtGui.QColor(self.editor.accent_color_secondary), 2.4)
-            self.setPen(pen)
+            self.setPen(self.editor.cached_pen(self.editor.accent_color_secondary, "highlight"))
             if self.delete_btn:
                 self.delete_btn.show()
         else:
@@ -3655,7 +4439,7 @@ class ConnectorItem(QtWidgets.QGraphicsEllipseItem):
                 self.delete_btn.hide()
 
     def align_label_left(self) -> None:
-        offset = self.label_item.boundingRect().width() + 6
+        offset = self.label_item.text_size().width() + 6
         self.label_item.setPos(-offset, -2)
 
     def add_connection(self, connection: "ConnectionItem") -> None:
@@ -3700,15 +4484,17 @@ class ConnectorItem(QtWidgets.QGraphicsEllipseItem):
 
 
 class ConnectionItem(QtWidgets.QGraphicsPathItem):
-    def __init__(self, start: ConnectorItem, end: ConnectorItem, color: str) -> None:
+    __slots__ = ("start_connector", "end_connector", "_last_endpoints", "_last_shape", "_path_template")
+
+    def __init__(self, start: ConnectorItem, end: ConnectorItem, color: str, editor: NodeEditorWidget) -> None:
         super().__init__()
         self.start_connector = start
         self.end_connector = end
-        pen = QtGui.QPen(QtGui.QColor(color or "#3f8efc"), 2)
-        pen.setCapStyle(QtCore.Qt.RoundCap)
-        pen.setJoinStyle(QtCore.Qt.RoundJoin)
-        self.setPen(pen)
+        self.setPen(editor.cached_pen(color or "#3f8efc", "connection"))
         self.setZValue(-1)
+        self._last_endpoints: tuple[float, float, float, float] | None = None
+        self._last_shape: tuple[float, float] | None = None
+        self._path_template: QtGui.QPainterPath | None = None
 
     def update_path(self) -> None:
         start = self.start_connector.scene_center()
@@ -3716,14 +4502,30 @@ class ConnectionItem(QtWidgets.QGraphicsPathItem):
         editor = self.start_connector.editor
         s = editor.snap_point(start)
         e = editor.snap_point(end)
-        mid_x = (s.x() + e.x()) / 2
-        p1 = QtCore.QPointF(mid_x, s.y())
-        p2 = QtCore.QPointF(mid_x, e.y())
-        path = QtGui.QPainterPath(s)
-        path.lineTo(p1)
-        path.lineTo(p2)
-        path.lineTo(e)
-        self.setPath(path)
+        # Most drag steps stay within the same grid cell; keep the existing path then.
+        key = (s.x(), s.y(), e.x(), e.y())
+        if key == self._last_endpoints:
+            return
+        self._last_endpoints = key
+        # The route only depends on the endpoint offset; dragging both ends together just translates it.
+        shape = (key[2] - key[0], key[3] - key[1])
+        if shape != self._last_shape:
+            dx, dy = shape
+            mid_x = dx / 2
+            template = QtGui.QPainterPath()
+            template.addPolygon(
+                QtGui.QPolygonF(
+                    [
+                        QtCore.QPointF(0, 0),
+                        QtCore.QPointF(mid_x, 0),
+                        QtCore.QPointF(mid_x, dy),
+                        QtCore.QPointF(dx, dy),
+                    ]
+                )
+            )
+            self._path_template = template
+            self._last_shape = shape
+        self.setPath(self._path_template.translated(key[0], key[1]))
 
 
 class NodeGraphicsView(QtWidgets.QGraphicsView):
@@ -3731,19 +4533,64 @@ class NodeGraphicsView(QtWidgets.QGraphicsView):
         super().__init__(scene)
         self.editor = editor
         self.setAcceptDrops(True)
+        self._grid_pen = QtGui.QPen(QtGui.QColor("#3e3e3e"), 0.5)
+        self._grid_cache_key: tuple[int, int, int, int, int] | None = None
+        self._grid_cache_rect = QtCore.QRectF()
+        self._grid_lines: list[QtCore.QLineF] = []
+        # Line-draft moves are coalesced to one update per frame; the latest position wins.
+        self._pending_move_pos: QtCore.QPointF | None = None
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._on_move_timer)
+
+    def _flush_line_move(self) -> bool:
+        pos = self._pending_move_pos
+        self._pending_move_pos = None
+        if pos is None:
+            return False
+        self.editor.handle_line_mouse_move(self.mapToScene(pos.toPoint()))
+        return True
+
+    def _on_move_timer(self) -> None:
+        if self._flush_line_move():
+            self._move_timer.start()
+
+    def enable_opengl_viewport(self) -> bool:
+        # Opt-in via config "opengl_viewport": some Windows GPU drivers render QOpenGLWidget viewports incorrectly.
+        try:
+            from PySide6 import QtOpenGLWidgets
+        except ImportError:
+            return False
+        fmt = QtGui.QSurfaceFormat()
+        fmt.setSwapBehavior(QtGui.QSurfaceFormat.DoubleBuffer)
+        fmt.setSamples(4)
+        viewport = QtOpenGLWidgets.QOpenGLWidget()
+        viewport.setFormat(fmt)
+        self.setViewport(viewport)
+        return True
 
     def drawBackground(self, painter: QtGui.QPainter, rect: QtCore.QRectF) -> None:
         super().drawBackground(painter, rect)
-        grid = float(self.editor.grid_size or 20)
-        left = int(rect.left()) - (int(rect.left()) % grid)
-        top = int(rect.top()) - (int(rect.top()) % grid)
-        lines = []
-        for x in range(int(left), int(rect.right()), int(grid)):
-            lines.append(QtCore.QLineF(x, rect.top(), x, rect.bottom()))
-        for y in range(int(top), int(rect.bottom()), int(grid)):
-            lines.append(QtCore.QLineF(rect.left(), y, rect.right(), y))
-        painter.setPen(QtGui.QPen(QtGui.QColor("#3e3e3e"), 0.5))
-        painter.drawLines(lines)
+        grid = int(self.editor.grid_size or 20)
+        # Lines cover the whole visible area in full grid cells; partial repaints are clipped by the painter.
+        if self._grid_cache_key is None or self._grid_cache_key[4] != grid or not self._grid_cache_rect.contains(rect):
+            area = self.mapToScene(self.viewport().rect()).boundingRect().united(rect)
+            key = (
+                int(area.left()) // grid,
+                int(area.top()) // grid,
+                int(area.right()) // grid + 1,
+                int(area.bottom()) // grid + 1,
+                grid,
+            )
+            if key != self._grid_cache_key:
+                left, top, right, bottom = key[0] * grid, key[1] * grid, key[2] * grid, key[3] * grid
+                self._grid_lines = [QtCore.QLineF(x, top, x, bottom) for x in range(left, right, grid)]
+                self._grid_lines += [QtCore.QLineF(left, y, right, y) for y in range(top, bottom, grid)]
+                self._grid_cache_key = key
+                self._grid_cache_rect = QtCore.QRectF(left, top, right - left, bottom - top)
+        painter.setPen(self._grid_pen)
+        painter.drawLines(self._grid_lines)
 
     def dragEnterEvent(self, event: QtGui.QDragEnterEvent) -> None:
         if event.mimeData().hasFormat("application/x-library-path"):
@@ -3775,34 +4622,45 @@ class NodeGraphicsView(QtWidgets.QGraphicsView):
         super().dropEvent(event)
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
+        self._flush_line_move()
         if self.editor.handle_line_mouse_press(event, self.mapToScene(event.position().toPoint())):
             event.accept()
             return
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:
-        if self.editor.handle_line_mouse_move(self.mapToScene(event.position().toPoint())):
+        if self.editor.is_line_drawing():
+            # Keep the viewport position; coalesced moves are only mapped to the scene once per flush.
+            self._pending_move_pos = event.position()
+            if not self._move_timer.isActive():
+                self._flush_line_move()
+                self._move_timer.start()
             event.accept()
             return
         super().mouseMoveEvent(event)
 
     def mouseDoubleClickEvent(self, event: QtGui.QMouseEvent) -> None:
+        self._flush_line_move()
         if self.editor.handle_line_mouse_double(event, self.mapToScene(event.position().toPoint())):
             event.accept()
             return
         super().mouseDoubleClickEvent(event)
 
+    @staticmethod
+    def _owning_block(item: QtWidgets.QGraphicsItem | None) -> NodeBlock | None:
+        while item is not None and not isinstance(item, NodeBlock):
+            item = item.parentItem()
+        return item
+
     def contextMenuEvent(self, event: QtGui.QContextMenuEvent) -> None:
-        scene_pos = self.mapToScene(event.pos())
-        items = self.scene().items(scene_pos)
-        target_block = None
-        for itm in items:
-            blk = itm
-            while blk and not isinstance(blk, NodeBlock):
-                blk = blk.parentItem()
-            if isinstance(blk, NodeBlock):
-                target_block = blk
-                break
+        top = self.itemAt(event.pos())
+        target_block = self._owning_block(top)
+        if target_block is None and top is not None:
+            # Topmost hit is a connection or line draft; look underneath it.
+            for itm in self.scene().items(self.mapToScene(event.pos())):
+                target_block = self._owning_block(itm)
+                if target_block is not None:
+                    break
         if target_block and target_block.is_basic():
             menu = QtWidgets.QMenu(self)
             delete_action = menu.addAction("Block löschen")
@@ -3824,8 +4682,7 @@ class RemoveButtonItem(QtWidgets.QGraphicsEllipseItem):
         self.setVisible(False)
         self._accent = "#13a8cd"
 
-        self.x_item = QtWidgets.QGraphicsSimpleTextItem("x", self)
-        self.x_item.setBrush(QtGui.QBrush(QtGui.QColor("#ffffff")))
+        self.x_item = StaticLabelItem("x", "#ffffff", self)
         self.x_item.setPos(3, -1)
         self.setAcceptHoverEvents(True)
 
@@ -3868,10 +4725,9 @@ class LibraryTree(QtWidgets.QTreeWidget):
         kind = item.data(0, QtCore.Qt.UserRole + 1)
         if kind:
             mime.setData("application/x-library-kind", str(kind).encode("utf-8"))
-        else:
-            from pathlib import Path as _Path
-            if path and "basic" in [p.lower() for p in _Path(str(path)).parts]:
-                mime.setData("application/x-library-kind", b"basic")
+        elif path and "basic" in Path(str(path).lower()).parts:
+            # Items below a library's basic folder already carry the kind; this covers roots inside one.
+            mime.setData("application/x-library-kind", b"basic")
         return mime
 
     def update_theme(self, colors: dict) -> None:
@@ -3884,6 +4740,16 @@ class PaletteDragButton(QtWidgets.QPushButton):
         super().__init__(text, parent)
         self.kind = kind
         self._drag_start_pos: QtCore.QPoint | None = None
+        self._drag_pixmap: QtGui.QPixmap | None = None
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self._drag_pixmap = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() in (QtCore.QEvent.StyleChange, QtCore.QEvent.PaletteChange, QtCore.QEvent.FontChange):
+            self._drag_pixmap = None
+        super().changeEvent(event)
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         if event.button() == QtCore.Qt.LeftButton:
@@ -3906,7 +4772,9 @@ class PaletteDragButton(QtWidgets.QPushButton):
         mime.setData("application/x-block-connector", self.kind.encode("utf-8"))
         drag = QtGui.QDrag(self)
         drag.setMimeData(mime)
-        pixmap = self.grab()
+        pixmap = self._drag_pixmap
+        if pixmap is None:
+            pixmap = self._drag_pixmap = self.grab()
         drag.setPixmap(pixmap)
         drag.setHotSpot(pixmap.rect().center())
         drag.exec(QtCore.Qt.CopyAction)
@@ -3919,14 +4787,32 @@ class LineDraftItem(QtWidgets.QGraphicsPathItem):
         pen.setCapStyle(QtCore.Qt.RoundCap)
         self.setPen(pen)
         self.setZValue(-0.5)
+        # Committed points are appended to _base once; only the preview segment is redone per move.
+        self._base = QtGui.QPainterPath()
+        self._first = QtCore.QPointF()
+        self._n = 0
 
-    def update_points(self, pts: list[QtCore.QPointF]) -> None:
+    def update_points(self, pts: list[QtCore.QPointF], preview: QtCore.QPointF | None = None) -> None:
         if not pts:
-            self.setPath(QtGui.QPainterPath())
+            self._base = QtGui.QPainterPath()
+            self._n = 0
+            self.setPath(self._base)
             return
-        path = QtGui.QPainterPath(pts[0])
-        for p in pts[1:]:
-            path.lineTo(p)
+        if len(pts) < self._n or (self._n and self._first != pts[0]):
+            self._base = QtGui.QPainterPath()
+            self._n = 0
+        if self._n == 0:
+            self._first = QtCore.QPointF(pts[0])
+            self._base.moveTo(self._first)
+            self._n = 1
+        for p in pts[self._n:]:
+            self._base.lineTo(p)
+        self._n = len(pts)
+        if preview is None:
+            self.setPath(self._base)
+            return
+        path = QtGui.QPainterPath(self._base)
+        path.lineTo(preview)
         self.setPath(path)
 
 
@@ -3944,8 +4830,15 @@ class UpdateCheckWorker(QtCore.QObject):
                 headers={"User-Agent": "Neuranel-Updater"},
             )
             with urllib.request.urlopen(req, timeout=8) as response:
-                payload = response.read().decode("utf-8-sig", errors="replace")
-            data = json.loads(payload)
+                if orjson is not None:
+                    raw = response.read().removeprefix(b"\xef\xbb\xbf")
+                    try:
+                        data = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        # Same tolerance for stray invalid UTF-8 bytes as the stdlib path.
+                        data = orjson.loads(raw.decode("utf-8", "replace"))
+                else:
+                    data = json.load(io.TextIOWrapper(response, encoding="utf-8-sig", errors="replace"))
             self.finished.emit(data, "")
         except Exception as exc:
             self.finished.emit(None, str(exc))
@@ -3955,25 +4848,49 @@ class NavListWidget(QtWidgets.QListWidget):
     hoverEntered = QtCore.Signal()
     hoverLeft = QtCore.Signal()
 
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        # Qt synthesizes extra enter/leave pairs on relayout and reparenting; emit only real transitions.
+        self._hovered = False
+
     def enterEvent(self, event: QtCore.QEvent) -> None:
         super().enterEvent(event)
-        self.hoverEntered.emit()
+        if not self._hovered:
+            self._hovered = True
+            self.hoverEntered.emit()
 
     def leaveEvent(self, event: QtCore.QEvent) -> None:
         super().leaveEvent(event)
-        self.hoverLeft.emit()
+        if self._hovered:
+            self._hovered = False
+            self.hoverLeft.emit()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        # No leave event arrives for a hidden widget.
+        self._hovered = False
+        super().hideEvent(event)
 
 
 class WidthAnimator(QtCore.QObject):
     def __init__(self, target: QtWidgets.QWidget, parent: QtCore.QObject | None = None) -> None:
         super().__init__(parent)
         self._target = target
+        self._last_width: int | None = None
 
     def _get_width(self) -> int:
         return self._target.width()
 
     def _set_width(self, value: int) -> None:
-        self._target.setFixedWidth(int(value))
+        # Each constraint change relayouts the parent, so skip ticks that round to the same width.
+        width = int(value)
+        if width == self._last_width:
+            return
+        self._last_width = width
+        target = self._target
+        if target.minimumWidth() != width:
+            target.setMinimumWidth(width)
+        if target.maximumWidth() != width:
+            target.setMaximumWidth(width)
 
     width = QtCore.Property(int, _get_width, _set_width)
 
@@ -3998,18 +4915,25 @@ class CoachMarkOverlay(QtWidgets.QWidget):
         self._closing = False
         self._is_animating = False
         self._step_anim: QtCore.QAbstractAnimation | None = None
+        self._overlay_color = QtGui.QColor()
+        self._highlight_pen = QtGui.QPen()
+        self._hole_path = QtGui.QPainterPath()
+        self._outline_path = QtGui.QPainterPath()
+        self.set_theme(window._current_colors())
 
         self.setObjectName("coachOverlay")
         self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
         self.setMouseTracking(True)
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
 
-        self._opacity_effect = QtWidgets.QGraphicsOpacityEffect(self)
-        self._opacity_effect.setOpacity(1.0)
-        self.setGraphicsEffect(self._opacity_effect)
+        self._opacity = 1.0
 
         self._card = QtWidgets.QFrame(self)
         self._card.setObjectName("coachCard")
+        # The dim layer fades via painter opacity; only the small card needs an effect, and only mid-fade.
+        self._card_opacity = QtWidgets.QGraphicsOpacityEffect(self._card)
+        self._card_opacity.setEnabled(False)
+        self._card.setGraphicsEffect(self._card_opacity)
         card_layout = QtWidgets.QVBoxLayout(self._card)
         card_layout.setContentsMargins(14, 12, 14, 12)
         card_layout.setSpacing(10)
@@ -4043,17 +4967,19 @@ class CoachMarkOverlay(QtWidgets.QWidget):
         btn_row.addWidget(self._next)
         card_layout.addLayout(btn_row)
 
-        window.installEventFilter(self)
-        if window.centralWidget():
-            window.centralWidget().installEventFilter(self)
-
-        self.setStyleSheet(window._build_stylesheet(window._current_colors()))
+        self._filtered: list[QtWidgets.QWidget] = []
         self.hide()
 
     def start(self) -> None:
         if not self._steps:
             self._finish()
             return
+        # Only watch the window while the tour is running.
+        self._filtered = [self._window]
+        if self._window.centralWidget():
+            self._filtered.append(self._window.centralWidget())
+        for watched in self._filtered:
+            watched.installEventFilter(self)
         self.setGeometry(self._window.rect())
         self.show()
         self.raise_()
@@ -4061,12 +4987,15 @@ class CoachMarkOverlay(QtWidgets.QWidget):
         self._apply_step()
 
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if self._closing or not self.isVisible():
+            return False
         if event.type() in (QtCore.QEvent.Resize, QtCore.QEvent.Move, QtCore.QEvent.LayoutRequest):
             self._schedule_recalculate()
         return super().eventFilter(obj, event)
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:  # type: ignore[override]
         super().resizeEvent(event)
+        self._update_paths()
         self._schedule_recalculate()
 
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
@@ -4081,26 +5010,34 @@ class CoachMarkOverlay(QtWidgets.QWidget):
             return
         super().keyPressEvent(event)
 
+    def set_theme(self, colors: dict[str, str]) -> None:
+        # Paint runs on every fade tick; colors only change with the theme.
+        self._overlay_color = QtGui.QColor(0, 0, 0, 150 if colors.get("theme") == "dark" else 130)
+        self._highlight_pen = QtGui.QPen(QtGui.QColor(colors.get("accent", "#007acc")))
+        self._highlight_pen.setWidth(2)
+        self.update()
+
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # type: ignore[override]
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        colors = self._window._current_colors()
-        overlay = QtGui.QColor(0, 0, 0, 150 if colors.get("theme") == "dark" else 130)
+        painter.setOpacity(self._opacity)
+        painter.fillPath(self._hole_path, self._overlay_color)
+        if not self._outline_path.isEmpty():
+            painter.setPen(self._highlight_pen)
+            painter.setBrush(QtCore.Qt.NoBrush)
+            painter.drawPath(self._outline_path)
 
+    def _update_paths(self) -> None:
+        # The dimmed shape only changes with size or highlight, not on opacity animation frames.
         path = QtGui.QPainterPath()
         path.addRect(QtCore.QRectF(self.rect()))
+        outline = QtGui.QPainterPath()
         if not self._highlight_rect.isNull():
-            hole = QtCore.QRectF(self._highlight_rect)
-            path.addRoundedRect(hole, 12, 12)
+            outline.addRoundedRect(QtCore.QRectF(self._highlight_rect), 12, 12)
+            path.addPath(outline)
             path.setFillRule(QtCore.Qt.OddEvenFill)
-        painter.fillPath(path, overlay)
-
-        if not self._highlight_rect.isNull():
-            pen = QtGui.QPen(QtGui.QColor(colors.get("accent", "#007acc")))
-            pen.setWidth(2)
-            painter.setPen(pen)
-            painter.setBrush(QtCore.Qt.NoBrush)
-            painter.drawRoundedRect(self._highlight_rect, 12, 12)
+        self._hole_path = path
+        self._outline_path = outline
 
     def _apply_step(self) -> None:
         self._index = max(0, min(self._index, len(self._steps) - 1))
@@ -4116,23 +5053,29 @@ class CoachMarkOverlay(QtWidgets.QWidget):
             self._recalc_timer = QtCore.QTimer(self)
             self._recalc_timer.setSingleShot(True)
             self._recalc_timer.timeout.connect(self._recalculate)
-        self._recalc_timer.start(0)
+        self._recalc_timer.start(16)
 
     def _recalculate(self) -> None:
         if self._closing or not self.isVisible():
             return
-        self.setGeometry(self._window.rect())
+        window_rect = self._window.rect()
+        if self.geometry() != window_rect:
+            self.setGeometry(window_rect)
         step = self._steps[self._index]
         self._highlight_rect = self._target_rect(step.target).adjusted(-8, -6, 8, 6)
+        self._update_paths()
         self._position_card()
         self.update()
 
     def _target_rect(self, widget: QtWidgets.QWidget) -> QtCore.QRect:
         if not widget:
             return QtCore.QRect()
-        top_left = widget.mapToGlobal(QtCore.QPoint(0, 0))
-        bottom_right = widget.mapToGlobal(QtCore.QPoint(widget.width(), widget.height()))
-        return QtCore.QRect(self.mapFromGlobal(top_left), self.mapFromGlobal(bottom_right))
+        if self._window.isAncestorOf(widget):
+            # The overlay is a direct child covering the window, so window coordinates only need its offset.
+            top_left = widget.mapTo(self._window, QtCore.QPoint(0, 0)) - self.pos()
+        else:
+            top_left = self.mapFromGlobal(widget.mapToGlobal(QtCore.QPoint(0, 0)))
+        return QtCore.QRect(top_left, top_left + QtCore.QPoint(widget.width(), widget.height()))
 
     def _position_card(self) -> None:
         margin = 16
@@ -4159,7 +5102,9 @@ class CoachMarkOverlay(QtWidgets.QWidget):
             if y + card_height > self.height() - margin:
                 y = max(margin, r.top() - margin - card_height)
 
-        self._card.setGeometry(x, y, card_width, card_height)
+        card_rect = QtCore.QRect(x, y, card_width, card_height)
+        if self._card.geometry() != card_rect:
+            self._card.setGeometry(card_rect)
 
     def _go_next(self) -> None:
         if self._is_animating:
@@ -4180,12 +5125,21 @@ class CoachMarkOverlay(QtWidgets.QWidget):
         if self._closing:
             return
         self._closing = True
+        for watched in self._filtered:
+            watched.removeEventFilter(self)
+        self._filtered = []
         if self._step_anim:
             self._step_anim.stop()
         self.hide()
         self.deleteLater()
         self.finished.emit()
 
+    def _set_opacity(self, value: float) -> None:
+        self._opacity = float(value)
+        self._card_opacity.setOpacity(self._opacity)
+        self._card_opacity.setEnabled(self._opacity < 1.0)
+        self.update()
+
     def _animate_to_index(self, new_index: int) -> None:
         if self._closing:
             return
@@ -4197,17 +5151,19 @@ class CoachMarkOverlay(QtWidgets.QWidget):
             self._step_anim.stop()
 
         self._is_animating = True
-        fade_out = QtCore.QPropertyAnimation(self._opacity_effect, b"opacity", self)
+        fade_out = QtCore.QVariantAnimation(self)
         fade_out.setDuration(260)
-        fade_out.setStartValue(float(self._opacity_effect.opacity()))
+        fade_out.setStartValue(float(self._opacity))
         fade_out.setEndValue(0.0)
         fade_out.setEasingCurve(QtCore.QEasingCurve.OutCubic)
+        fade_out.valueChanged.connect(self._set_opacity)
 
-        fade_in = QtCore.QPropertyAnimation(self._opacity_effect, b"opacity", self)
+        fade_in = QtCore.QVariantAnimation(self)
         fade_in.setDuration(320)
         fade_in.setStartValue(0.0)
         fade_in.setEndValue(1.0)
         fade_in.setEasingCurve(QtCore.QEasingCurve.OutCubic)
+        fade_in.valueChanged.connect(self._set_opacity)
 
         def swap_step() -> None:
             if self._closing:
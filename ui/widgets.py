@@ -4,6 +4,8 @@ from pathlib import Path
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+_BTN_OBJ = {"danger": "dangerButton", "secondary": "secondaryButton"}
+
 
 class ProjectCard(QtWidgets.QFrame):
     def __init__(self, title: str, parent: QtWidgets.QWidget | None = None, with_header: bool = True) -> None:
@@ -41,11 +43,88 @@ class ProjectCard(QtWidgets.QFrame):
         layout.addWidget(self.list_widget)
 
     def _apply_shadow(self) -> None:
-        shadow = QtWidgets.QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 10)
-        shadow.setColor(QtGui.QColor(40, 80, 120, 60))
-        self.setGraphicsEffect(shadow)
+        self._shadow = _CardShadow(self)
+
+    def event(self, event: QtCore.QEvent) -> bool:
+        etype = event.type()
+        if etype == QtCore.QEvent.ParentChange:
+            self._shadow.attach()
+        elif etype in (QtCore.QEvent.Move, QtCore.QEvent.Resize, QtCore.QEvent.Show, QtCore.QEvent.ZOrderChange):
+            self._shadow.sync()
+        elif etype == QtCore.QEvent.Hide:
+            self._shadow.hide()
+        return super().event(event)
+
+
+class _CardShadow(QtWidgets.QWidget):
+    """Pre-blurred drop shadow painted as a sibling underneath a card."""
+
+    BLUR = 20
+    OFFSET = QtCore.QPoint(0, 10)
+    RADIUS = 14
+    COLOR = QtGui.QColor(40, 80, 120, 60)
+
+    def __init__(self, card: QtWidgets.QWidget) -> None:
+        super().__init__(card.parentWidget())
+        self._card = card
+        self._pixmap: QtGui.QPixmap | None = None
+        self._pixmap_size = QtCore.QSize()
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
+        self.hide()
+
+    def attach(self) -> None:
+        parent = self._card.parentWidget()
+        if parent is not self.parentWidget():
+            self.setParent(parent)
+        self.sync()
+
+    def sync(self) -> None:
+        if self.parentWidget() is None or not self._card.isVisible():
+            self.hide()
+            return
+        margin = self.BLUR
+        geom = self._card.geometry().adjusted(-margin, -margin, margin, margin).translated(self.OFFSET)
+        if geom != self.geometry():
+            self.setGeometry(geom)
+        self.stackUnder(self._card)
+        self.show()
+
+    def _render(self, size: QtCore.QSize) -> QtGui.QPixmap:
+        image = QtGui.QImage(size, QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(QtCore.Qt.transparent)
+        shape = QtGui.QPixmap(size)
+        shape.fill(QtCore.Qt.transparent)
+        shape_painter = QtGui.QPainter(shape)
+        shape_painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        shape_painter.setPen(QtCore.Qt.NoPen)
+        shape_painter.setBrush(self.COLOR)
+        margin = self.BLUR
+        shape_painter.drawRoundedRect(
+            QtCore.QRectF(margin, margin, size.width() - 2 * margin, size.height() - 2 * margin),
+            self.RADIUS,
+            self.RADIUS,
+        )
+        shape_painter.end()
+        # Blur once per size through an offscreen scene instead of a live graphics effect.
+        scene = QtWidgets.QGraphicsScene()
+        item = QtWidgets.QGraphicsPixmapItem(shape)
+        blur = QtWidgets.QGraphicsBlurEffect()
+        blur.setBlurRadius(self.BLUR)
+        item.setGraphicsEffect(blur)
+        scene.addItem(item)
+        painter = QtGui.QPainter(image)
+        scene.render(painter, QtCore.QRectF(image.rect()), QtCore.QRectF(0, 0, size.width(), size.height()))
+        painter.end()
+        return QtGui.QPixmap.fromImage(image)
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        size = self.size()
+        if self._pixmap is None or self._pixmap_size != size:
+            self._pixmap = self._render(size)
+            self._pixmap_size = size
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
 
 
 class ProjectItem(QtWidgets.QWidget):
@@ -69,25 +148,32 @@ class ProjectItem(QtWidgets.QWidget):
         self._spinner_timer: QtCore.QTimer | None = None
         self._base_status_text = ""
         self._default_status_prefix = ""
+        self._progress_tmpl = " %.1f MB / %.1f MB"
+        self._last_progress: tuple[float, float] | None = None
+        self._pending_progress: tuple[float, float] | None = None
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_progress)
         self._static_disabled = not enabled
         self._variant = variant
         self._prev_button_text: str | None = None
         self._prev_button_style: str | None = None
         self.extra_buttons: list[QtWidgets.QPushButton] = []
+        self._extra_labels: list[str] = []
+        self._extra_objs: list[str] = []
+        self.project_name = name
         layout = QtWidgets.QHBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
         layout.setSpacing(10)
 
         name_label = QtWidgets.QLabel(name)
         name_label.setObjectName("itemName")
+        self.name_label = name_label
 
         holder_label = QtWidgets.QLabel()
         holder_label.setObjectName("holderLabel")
-        if holder:
-            date_info = f" - {timestamp}" if timestamp else ""
-            holder_label.setText(f"held by {holder}{date_info}")
-        else:
-            holder_label.setText("")
+        holder_label.setText(self._holder_text(holder, timestamp))
         self.holder_label = holder_label
 
         self.status_label = QtWidgets.QLabel("")
@@ -102,7 +188,7 @@ class ProjectItem(QtWidgets.QWidget):
         text_layout.addWidget(self.status_label)
 
         self.button = QtWidgets.QPushButton(action_label)
-        btn_obj = "dangerButton" if variant == "danger" else ("secondaryButton" if variant == "secondary" else "actionButton")
+        btn_obj = _BTN_OBJ.get(variant, "actionButton")
         self.button.setObjectName(btn_obj)
         self.button.setCursor(QtCore.Qt.PointingHandCursor)
         self.button.setEnabled(enabled)
@@ -114,7 +200,6 @@ class ProjectItem(QtWidgets.QWidget):
         btn_row.setContentsMargins(0, 0, 0, 0)
         btn_row.setSpacing(6)
 
-        targets: list[tuple[str, str, bool, object]] = []
         for extra in extra_actions or []:
             label = extra.get("label")
             handler = extra.get("handler")
@@ -123,24 +208,60 @@ class ProjectItem(QtWidgets.QWidget):
             if not label:
                 continue
             btn = QtWidgets.QPushButton(label)
-            btn.setCursor(QtCore.Qt.PointingHandCursor)
-            btn_obj_extra = "dangerButton" if variant_extra == "danger" else ("secondaryButton" if variant_extra == "secondary" else "actionButton")
+            btn_obj_extra = _BTN_OBJ.get(variant_extra, "actionButton")
             btn.setObjectName(btn_obj_extra)
+            btn.setCursor(QtCore.Qt.PointingHandCursor)
             btn.setEnabled(enabled_extra)
             if handler:
                 btn.clicked.connect(handler)
             self.extra_buttons.append(btn)
-            targets.append((label, btn_obj_extra, enabled_extra, btn))
+            self._extra_labels.append(label)
+            self._extra_objs.append(btn_obj_extra)
+            btn_row.addWidget(btn)
 
         if main_last:
-            targets.append((action_label, btn_obj, enabled, self.button))
+            btn_row.addWidget(self.button)
         else:
-            targets.insert(0, (action_label, btn_obj, enabled, self.button))
-
-        for _, _, _, btn in targets:
-            btn_row.addWidget(btn)
+            btn_row.insertWidget(0, self.button)
 
         layout.addLayout(btn_row)
+        # Rows with the same key have the same buttons and can be reused for another project.
+        self.layout_key = (tuple(self._extra_labels), main_last)
+
+    @staticmethod
+    def _holder_text(holder: str | None, timestamp: str | None) -> str:
+        if not holder:
+            return ""
+        date_info = f" - {timestamp}" if timestamp else ""
+        return f"held by {holder}{date_info}"
+
+    @property
+    def is_loading(self) -> bool:
+        return bool(self._default_status_prefix)
+
+    def update_state(
+        self,
+        name: str,
+        holder: str | None,
+        timestamp: str | None,
+        action_label: str,
+        *,
+        enabled: bool = True,
+        variant: str = "action",
+    ) -> None:
+        self.project_name = name
+        self.name_label.setText(name)
+        self.holder_label.setText(self._holder_text(holder, timestamp))
+        self.status_label.setText("")
+        self.button.setText(action_label)
+        btn_obj = _BTN_OBJ.get(variant, "actionButton")
+        if self.button.objectName() != btn_obj:
+            self.button.setObjectName(btn_obj)
+            self.button.style().unpolish(self.button)
+            self.button.style().polish(self.button)
+        self.button.setEnabled(enabled)
+        self._static_disabled = not enabled
+        self._variant = variant
 
     def show_loading(self, text: str) -> None:
         self._prev_button_text = self.button.text()
@@ -150,6 +271,9 @@ class ProjectItem(QtWidgets.QWidget):
         self.button.setStyleSheet("background: #4d9cd6; color: #ffffff;")
         self._base_status_text = text
         self._default_status_prefix = text
+        self._progress_tmpl = text + " %.1f MB / %.1f MB"
+        self._last_progress = None
+        self._pending_progress = None
         self.status_label.show()
         self.status_label.setText(f"{text} ...")
 
@@ -158,6 +282,9 @@ class ProjectItem(QtWidgets.QWidget):
         if self._prev_button_text is not None:
             self.button.setText(self._prev_button_text)
         self.button.setStyleSheet(self._prev_button_style or "")
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self._last_progress = None
         self.status_label.setText("")
         self._base_status_text = ""
         self._default_status_prefix = ""
@@ -165,15 +292,35 @@ class ProjectItem(QtWidgets.QWidget):
     def update_progress(self, done_bytes: int, total_bytes: int) -> None:
         if total_bytes <= 0:
             total_bytes = 1
-        mb_done = done_bytes / (1024 * 1024)
-        mb_total = total_bytes / (1024 * 1024)
-        self.status_label.setText(f"{self._base_status_text} {mb_done:.1f} MB / {mb_total:.1f} MB")
+        progress = (round(done_bytes / (1024 * 1024), 1), round(total_bytes / (1024 * 1024), 1))
+        if self._progress_timer.isActive():
+            self._pending_progress = progress
+            return
+        self._apply_progress(progress)
+        self._progress_timer.start()
+
+    def _flush_progress(self) -> None:
+        progress = self._pending_progress
+        if progress is not None:
+            self._pending_progress = None
+            self._apply_progress(progress)
+            self._progress_timer.start()
+
+    def _apply_progress(self, progress: tuple[float, float]) -> None:
+        if progress == self._last_progress:
+            return
+        self._last_progress = progress
+        self.status_label.setText(self._progress_tmpl % progress)
 
     def set_status_prefix(self, prefix: str | None) -> None:
         if prefix:
             self._base_status_text = prefix
         else:
             self._base_status_text = self._default_status_prefix
+        tmpl = self._base_status_text + " %.1f MB / %.1f MB"
+        if tmpl != self._progress_tmpl:
+            self._progress_tmpl = tmpl
+            self._last_progress = None
 
 
 class TitleBar(QtWidgets.QFrame):
@@ -184,7 +331,14 @@ class TitleBar(QtWidgets.QFrame):
         self.setObjectName("titleBar")
         self._drag_pos: QtCore.QPoint | None = None
         self._was_maximized = False
-        self._system_move_started = False
+        self._press_pos: QtCore.QPoint | None = None
+        self._manual_move = False
+        # Fallback drag without a system move: coalesce to the last position.
+        self._pending_move: QtCore.QPoint | None = None
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(8)
+        self._move_timer.timeout.connect(self._apply_pending_move)
 
         layout = QtWidgets.QHBoxLayout(self)
         layout.setContentsMargins(5, 0, 0, 0)
@@ -194,9 +348,14 @@ class TitleBar(QtWidgets.QFrame):
         self.logo_label.setObjectName("titleBarLogo")
         self.logo_label.setFixedSize(26, 26)
         self.logo_label.setScaledContents(True)
-        if logo_path and Path(logo_path).exists():
-            pix = QtGui.QPixmap(str(logo_path))
-            self.logo_label.setPixmap(pix)
+        if logo_path:
+            key = f"titlebar_logo:{logo_path}"
+            pix = QtGui.QPixmapCache.find(key)
+            if pix is None and Path(logo_path).exists():
+                pix = QtGui.QPixmap(str(logo_path))
+                QtGui.QPixmapCache.insert(key, pix)
+            if pix is not None:
+                self.logo_label.setPixmap(pix)
 
         layout.addWidget(self.logo_label)
         self.extra_layout = QtWidgets.QHBoxLayout()
@@ -241,6 +400,7 @@ class TitleBar(QtWidgets.QFrame):
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         if event.button() == QtCore.Qt.LeftButton:
+            self._manual_move = False
             self._was_maximized = self._window.isMaximized()
             global_pos = event.globalPosition().toPoint()
             if self._was_maximized:
@@ -250,7 +410,7 @@ class TitleBar(QtWidgets.QFrame):
                 new_y = global_pos.y() - 10
                 self._window.move(new_x, new_y)
                 self._was_maximized = False
-            self._system_move_started = False
+            self._press_pos = global_pos
             self._drag_pos = global_pos - self._window.frameGeometry().topLeft()
             event.accept()
         super().mousePressEvent(event)
@@ -258,20 +418,34 @@ class TitleBar(QtWidgets.QFrame):
     def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:
         if self._drag_pos and event.buttons() & QtCore.Qt.LeftButton:
             global_pos = event.globalPosition().toPoint()
-            if not self._system_move_started:
+            if not self._manual_move:
+                # Hand the drag to the window manager only once it is a real drag, so clicks stay ours.
+                if (global_pos - self._press_pos).manhattanLength() < QtWidgets.QApplication.startDragDistance():
+                    event.accept()
+                    return
                 handle = self._window.windowHandle()
                 if handle and handle.startSystemMove():
-                    self._system_move_started = True
                     self._drag_pos = None
                     event.accept()
                     return
-            self._window.move(global_pos - self._drag_pos)
+                self._manual_move = True
+            self._pending_move = global_pos - self._drag_pos
+            if not self._move_timer.isActive():
+                self._move_timer.start()
             event.accept()
         super().mouseMoveEvent(event)
 
+    def _apply_pending_move(self) -> None:
+        if self._pending_move is not None:
+            self._window.move(self._pending_move)
+            self._pending_move = None
+
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
+        self._move_timer.stop()
+        self._apply_pending_move()
         self._drag_pos = None
-        self._system_move_started = False
+        self._press_pos = None
+        self._manual_move = False
         super().mouseReleaseEvent(event)
 
     def mouseDoubleClickEvent(self, event: QtGui.QMouseEvent) -> None:
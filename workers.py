@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import stat
+import time
 
 from PySide6 import QtCore
 
@@ -15,6 +16,9 @@ def _handle_remove_readonly(func, path, exc_info):
         raise
 
 
+_PROGRESS_INTERVAL_NS = 50_000_000
+
+
 class MoveWorker(QtCore.QObject):
     finished = QtCore.Signal(bool, str)
     progress = QtCore.Signal(int, int, str)
@@ -25,11 +29,46 @@ class MoveWorker(QtCore.QObject):
 
     @QtCore.Slot()
     def run(self) -> None:
+        last_emit_ns = 0
+        last_stage: str | None = None
+
         try:
             def emit_progress(done: int, total: int, stage: str | None = "") -> None:
-                self.progress.emit(done, total, stage or "")
+                # Coalesce to one queued signal per 50 ms; stage changes and completion always go out.
+                nonlocal last_emit_ns, last_stage
+                stage = stage or ""
+                now = time.monotonic_ns()
+                if now - last_emit_ns < _PROGRESS_INTERVAL_NS and done != total and stage == last_stage:
+                    return
+                last_emit_ns = now
+                last_stage = stage
+                self.progress.emit(done, total, stage)
 
             self.work_fn(emit_progress)
             self.finished.emit(True, "")
         except Exception as exc:  # noqa: BLE001
             self.finished.emit(False, str(exc))
+
+
+class TaskSignals(QtCore.QObject):
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+
+
+class TaskRunnable(QtCore.QRunnable):
+    """Runs a plain callable on a QThreadPool and reports the result via signals."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = TaskSignals()
+        # The owner keeps a reference until a signal arrives; Qt must not delete it first.
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+        try:
+            result = self.fn()
+        except Exception as exc:  # noqa: BLE001
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(result)